@@ -47,6 +47,10 @@ class AiBastion:
 
         self.ghast_emergency = False
 
+        # Own units, refreshed once per update
+        self.ally_count = 0
+        self.ally_summary = {}
+
         # History for adaptiveness
         self.last_known_enemy_count = 0
         self.last_loss_count = 0
@@ -58,6 +62,10 @@ class AiBastion:
 
         self.time_since_last_counter_attack += dt
 
+        allies = [e for e, t in wp.teams.items() if t.team_id == self.team_id]
+        self.ally_count = len(allies)
+        self.ally_summary = self._summarize_by_type(wp, allies)
+
         base_ent, base_danger = wp.bases[self.team_id]
         enemies = self._get_enemies_near_base(wp, base_ent)
         enemy_summary = self._summarize_by_type(wp, enemies)
@@ -186,13 +194,7 @@ class AiBastion:
             "balanced": {EntityType.BRUTE: 1, EntityType.CROSSBOWMAN: 1},
         }[mode]
 
-        counts = {t: 0 for t in req}
-        for ent, team in wp.teams.items():
-            if team.team_id != self.team_id:
-                continue
-            et = wp.entity_types.get(ent)
-            if et in counts:
-                counts[et] += 1
+        counts = {t: self.ally_summary.get(t, 0) for t in req}
 
         for et, needed in req.items():
             missing = needed - counts[et]
@@ -341,22 +343,13 @@ class AiBastion:
         return summary
 
     def _has_ally(self, entity_type):
-        wp = get_world_perception()
-        return any(
-            wp.teams[e].team_id == self.team_id
-            and wp.entity_types.get(e) == entity_type
-            for e in wp.teams
-        )
+        return self.ally_summary.get(entity_type, 0) > 0
 
     def _count_allies(self, wp):
-        return sum(1 for e, t in wp.teams.items() if t.team_id == self.team_id)
+        return self.ally_count
 
     def _count_allies_of_type(self, wp, t):
-        return sum(
-            1
-            for e, tm in wp.teams.items()
-            if tm.team_id == self.team_id and wp.entity_types.get(e) == t
-        )
+        return self.ally_summary.get(t, 0)
 
     def _can_afford(self, et, money):
         return money >= self.costs.get(et, 999999)
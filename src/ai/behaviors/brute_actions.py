@@ -49,7 +49,7 @@ def perform_attack(attacker_id: int, target_id: int):
     damage = atk.damage
     get_event_bus().emit(AttackEvent(attacker_id, target_id))
 
-    get_debugger().log(f"{attacker_id} > Attack {target_id} for {damage} dmg.")
+    get_debugger().log("%s > Attack %s for %s dmg.", attacker_id, target_id, damage)
 
 
 def ally_in_danger(state: AiState) -> bool:
@@ -71,7 +71,7 @@ def ally_in_danger(state: AiState) -> bool:
     if not state.weakness_ally or state.weakness_ally not in state.allies:
         return False
 
-    get_debugger().log(f"{state.entity} > Alert level : {state.alert_level}")
+    get_debugger().log("%s > Alert level : %s", state.entity, state.alert_level)
 
     if state.alert_level < 0.2:
         return False
@@ -82,7 +82,7 @@ def ally_in_danger(state: AiState) -> bool:
     _, _, _, danger_score = state.allies[state.weakness_ally]
     # Check if protection is urgent
     get_debugger().log(
-        f"{state.entity} > Danger score for {state.weakness_ally} : {danger_score}"
+        "%s > Danger score for %s : %s", state.entity, state.weakness_ally, danger_score
     )
     urgent = danger_score > 0.3
 
@@ -94,16 +94,16 @@ def ally_in_danger(state: AiState) -> bool:
     # If danger is not urgent , check if fight is critical
     if not urgent and state.in_combat and state.nearest_enemy:
 
-        get_debugger().log(f"{state.entity} > Check for help")
+        get_debugger().log("%s > Check for help", state.entity)
         enemy_id, _, _ = state.nearest_enemy
         enemy_health = esper.component_for_entity(enemy_id, Health)
         enemy_ratio = enemy_health.remaining / enemy_health.full
         # Enemy almost dead
         if enemy_ratio < 0.5:
-            get_debugger().log(f"{state.entity} > Continue fighting")
+            get_debugger().log("%s > Continue fighting", state.entity)
             return False
     if urgent:
-        get_debugger().log(f"{state.entity} > Go help {state.weakness_ally}")
+        get_debugger().log("%s > Go help %s", state.entity, state.weakness_ally)
     return urgent
 
 
@@ -149,8 +149,13 @@ class RetreatAction(BaseAction):
         """
         state = self.ai_state
         get_debugger().log(
-            f"{state.entity} > Retreat {state.action_weights} "
-            f"{state._emotions} {state.alert_level} {state.enemies} {state.under_attack}"
+            "%s > Retreat %s %s %s %s %s",
+            state.entity,
+            state.action_weights,
+            state._emotions,
+            state.alert_level,
+            state.enemies,
+            state.under_attack,
         )
 
         if not state.enemies:
@@ -236,13 +241,23 @@ class ProtectAction(BaseAction):
         state = self.ai_state
 
         get_debugger().log(
-            f"{state.entity} > Protect {state.action_weights} {state._emotions} {state.alert_level} {state.enemies} {state.under_attack}"
+            "%s > Protect %s %s %s %s %s",
+            state.entity,
+            state.action_weights,
+            state._emotions,
+            state.alert_level,
+            state.enemies,
+            state.under_attack,
         )
         if state.weakness_ally is None or state.weakness_ally not in state.allies:
             return Status.FAILURE
 
         get_debugger().log(
-            f"{state.entity} > Moving to protect ally {state.weakness_ally}. {state.action_weights}, {state._emotions}"
+            "%s > Moving to protect ally %s. %s, %s",
+            state.entity,
+            state.weakness_ally,
+            state.action_weights,
+            state._emotions,
         )
 
         ally_pos = state.allies[state.weakness_ally][0]
@@ -277,7 +292,13 @@ class AttackAction(BaseAction):
         state = self.ai_state
 
         get_debugger().log(
-            f"{state.entity} > Attack {state.action_weights} {state._emotions} {state.alert_level} {state.enemies} {state.under_attack}"
+            "%s > Attack %s %s %s %s %s",
+            state.entity,
+            state.action_weights,
+            state._emotions,
+            state.alert_level,
+            state.enemies,
+            state.under_attack,
         )
         atk: Attack = state.atk
 
@@ -324,7 +345,7 @@ class TargetObjective(BaseAction):
         """
         state = self.ai_state
 
-        get_debugger().log(f"{state.entity} > Target : {state.enemy_base_pos}")
+        get_debugger().log("%s > Target : %s", state.entity, state.enemy_base_pos)
         if state.enemy_base_pos:
             base_pos = (state.enemy_base_pos.x, state.enemy_base_pos.y)
             tile_size = state._tile_size
@@ -359,7 +380,7 @@ class WanderAction(BaseAction):
         """
         state = self.ai_state
 
-        get_debugger().log(f"{state.entity} > Wander")
+        get_debugger().log("%s > Wander", state.entity)
 
         if not state.path or not state.destination:
             # get_debugger().log(f"{state.entity} > Wandering to a new random location.")
@@ -426,7 +447,7 @@ class MovementManager:
 
         if dist < 16:
             get_debugger().log(
-                f"{state.entity} > Reached waypoint {state.destination}."
+                "%s > Reached waypoint %s.", state.entity, state.destination
             )
             state.path.pop(0)
 
@@ -474,7 +495,10 @@ class DefendBaseAction(BaseAction):
         tile_size = get_config().get(ConfigKey.TILE_SIZE.value)
 
         get_debugger().log(
-            f"{state.entity} > Defend base {state.action_weights} {state._emotions}"
+            "%s > Defend base %s %s",
+            state.entity,
+            state.action_weights,
+            state._emotions,
         )
 
         dist_to_base = math.hypot(base_pos.x - state.pos.x, base_pos.y - state.pos.y)
@@ -497,12 +521,14 @@ class DefendBaseAction(BaseAction):
 
         # if an enemy is near attack it
         if state.nearest_enemy and state.nearest_enemy[2] <= state.atk.range:
-            get_debugger().log(f"{state.entity} > Attacking near base!")
+            get_debugger().log("%s > Attacking near base!", state.entity)
             return AttackAction(state).execute()
 
         # else go to defend
         if dist_to_base > tile_size * 2:
-            get_debugger().log(f"{state.entity} > Moving to defend base at {base_pos}")
+            get_debugger().log(
+                "%s > Moving to defend base at %s", state.entity, base_pos
+            )
             return MovementManager.move_to(state, (base_pos.x, base_pos.y))
 
         return Status.RUNNING
@@ -26,6 +26,7 @@ class MAPIGhast(BaseAi):
     def __init__(self, ghast_entity):
         self.ghast = ghast_entity
         self.target_building = None
+        self._bases = None
 
         ghast_base = UNITS[EntityType.GHAST]
         self.stats = {}
@@ -92,13 +93,14 @@ class MAPIGhast(BaseAi):
             return
 
         # Fuir si trop de crossbow proches
-        if self._get_number_crossbow_near(pos, team.team_id)[0] > 0:
+        crossbow_near = self._get_number_crossbow_near(pos, team.team_id)
+        if crossbow_near[0] > 0:
             # print("- Fleeing due to too many nearby enemies")
             self._flee(pos, enemies)
             return
 
         # Voir si c'est bénéfique de rester derrière un allié en fonction de la distance ennemie
-        if ally and self._get_number_crossbow_near(pos, team.team_id)[1] < 90:
+        if ally and crossbow_near[1] < 90:
             # print("- Staying behind ally")
             self._stay_behind_ally(pos, ally)
             return
@@ -150,15 +152,20 @@ class MAPIGhast(BaseAi):
         Retourne le nombre de crossbow à proximité.
         """
         nb_enemies = 0
-        dist = float("inf")
+        dist_sq = float("inf")
+        px, py = pos.x, pos.y
         for ent, t in esper.get_component(Team):
+            if t.team_id == my_team:
+                continue
             entity_type = esper.component_for_entity(ent, EntityType)
-            if t.team_id != my_team and entity_type == EntityType.CROSSBOWMAN:
+            if entity_type == EntityType.CROSSBOWMAN:
                 ent_pos = esper.component_for_entity(ent, Position)
-                dist = ((ent_pos.x - pos.x) ** 2 + (ent_pos.y - pos.y) ** 2) ** 0.5
-                if dist < 150:
+                dx = ent_pos.x - px
+                dy = ent_pos.y - py
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < 22500:  # 150 px
                     nb_enemies += 1
-        return [nb_enemies, dist]
+        return [nb_enemies, dist_sq**0.5]
 
     def _get_closest_ally(self, pos, my_team):
         """
@@ -190,12 +197,13 @@ class MAPIGhast(BaseAi):
     def _flee(self, pos, enemies):
         if not enemies:
             return
-        avg_x = sum(esper.component_for_entity(e, Position).x for e in enemies) / len(
-            enemies
-        )
-        avg_y = sum(esper.component_for_entity(e, Position).y for e in enemies) / len(
-            enemies
-        )
+        sum_x = sum_y = 0.0
+        for e in enemies:
+            enemy_pos = esper.component_for_entity(e, Position)
+            sum_x += enemy_pos.x
+            sum_y += enemy_pos.y
+        avg_x = sum_x / len(enemies)
+        avg_y = sum_y / len(enemies)
         dx = pos.x - avg_x
         dy = pos.y - avg_y
         flee_x = pos.x + dx
@@ -262,6 +270,12 @@ class MAPIGhast(BaseAi):
             self._move_towards(pos, base_pos)
 
     def _get_bases(self, my_team_id):
+        # Les bastions ne bougent pas : on garde le résultat tant qu'ils existent
+        if self._bases is not None and all(
+            esper.entity_exists(base[0]) for base in self._bases
+        ):
+            return self._bases
+
         ally_base = None
         enemy_base = None
         for ent, t in esper.get_component(Team):
@@ -275,4 +289,9 @@ class MAPIGhast(BaseAi):
                     ally_base = (ent, h)
                 else:
                     enemy_base = (ent, h)
+
+        if ally_base and enemy_base:
+            self._bases = (ally_base, enemy_base)
+        else:
+            self._bases = None
         return ally_base, enemy_base
@@ -140,8 +140,9 @@ class WorldPerception:
             vision_range = self._get_vision_range(ent1)
 
             allow_target = None
-            if esper.has_component(ent1, Target):
-                allow_target = esper.component_for_entity(ent1, Target).allow_targets
+            target = esper.try_component(ent1, Target)
+            if target is not None:
+                allow_target = target.allow_targets
 
             for ent2, pos2 in self.positions.items():
                 if ent1 == ent2:
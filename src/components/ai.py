@@ -23,13 +23,13 @@ class AIStateType(Enum):
     SUPPORTING = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class AIState:
     state: AIStateType = AIStateType.IDLE
     state_timer: float = 0.0  # seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class AIMemory:
     current_target_id: int = None
     last_known_target_pos: tuple = None
@@ -37,8 +37,13 @@ class AIMemory:
     assignment_active: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PathRequest:
     destination: tuple = None
     path: list = None
     current_index: int = 0
+
+
+@dataclass(slots=True)
+class LOVAControlled:
+    """Marker for units driven by the LOVA AI processor."""
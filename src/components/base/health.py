@@ -9,6 +9,8 @@ class Health(Component):
     full : int : the full health of the entity
     """
 
+    __slots__ = ("remaining", "full")
+
     remaining: int
     full: int
 
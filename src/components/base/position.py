@@ -5,6 +5,8 @@ from core.ecs.component import Component
 
 class Position(Component):
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int = 1, y: int = 1):
         self.x = x
         self.y = y
@@ -6,5 +6,7 @@ NEUTRAL_TEAM = 0
 
 
 class Team(Component):
+    __slots__ = ("team_id",)
+
     def __init__(self, team_id=PLAYER_1_TEAM):
         self.team_id = team_id
@@ -4,6 +4,8 @@ from core.ecs.component import Component
 class Velocity(Component):
     """Composant who represent the velocity of an entity"""
 
+    __slots__ = ("x", "y", "speed")
+
     x: float
     y: float
     speed: int
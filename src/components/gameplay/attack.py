@@ -5,6 +5,8 @@ from core.config import Config
 class Attack(Component):
     """Composant who represent the ability to attack of an entity"""
 
+    __slots__ = ("damage", "range", "attack_speed", "last_attack")
+
     def __init__(
         self, damage: int, range: int, attack_speed: float, last_attack: int = 0
     ):
@@ -1,10 +1,78 @@
+import copy
+import weakref
+
 from core.ecs.component import Component
 from enums.entity.unit_type import UnitType
 
 
 class Target(Component):
+
+    __slots__ = ("allow_targets", "_target_entity_id", "__weakref__")
+
+    # Reverse index: entity id -> Target components currently aiming at it
+    _targeted_by: dict[int, weakref.WeakSet] = {}
+
     def __init__(
         self, target_entity_id: int = None, allow_targets: list[UnitType] = None
     ):
         self.allow_targets: list[UnitType] = allow_targets
+        self._target_entity_id: int = None
         self.target_entity_id = target_entity_id
+
+    def __getstate__(self):
+        return {
+            "allow_targets": self.allow_targets,
+            "target_entity_id": self._target_entity_id,
+        }
+
+    def __setstate__(self, state):
+        # Go through the setter so restored copies are registered in the index
+        self.allow_targets = state["allow_targets"]
+        self._target_entity_id = None
+        self.target_entity_id = state["target_entity_id"]
+
+    def __deepcopy__(self, memo):
+        clone = Target.__new__(Target)
+        memo[id(self)] = clone
+        clone.__setstate__(
+            {
+                "allow_targets": copy.deepcopy(self.allow_targets, memo),
+                "target_entity_id": self._target_entity_id,
+            }
+        )
+        return clone
+
+    @property
+    def target_entity_id(self) -> int:
+        return self._target_entity_id
+
+    @target_entity_id.setter
+    def target_entity_id(self, value: int):
+        old = self._target_entity_id
+        if old == value:
+            return
+        if old is not None:
+            holders = Target._targeted_by.get(old)
+            if holders is not None:
+                holders.discard(self)
+                if not holders:
+                    del Target._targeted_by[old]
+        self._target_entity_id = value
+        if value is not None:
+            Target._targeted_by.setdefault(value, weakref.WeakSet()).add(self)
+
+    @staticmethod
+    def release(entity_id: int):
+        """
+        Clear every Target currently aiming at an entity.
+
+        Args:
+            entity_id: Entity that can no longer be targeted
+        """
+        for target in list(Target._targeted_by.pop(entity_id, ())):
+            target._target_entity_id = None
+
+    @staticmethod
+    def clear_index():
+        """Forget every targeting reference, e.g. when the world is cleared."""
+        Target._targeted_by.clear()
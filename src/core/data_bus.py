@@ -10,15 +10,15 @@ class DataBus:
 
     def register(self, key: DataBusKey, instance: Any):
         self._store[key] = instance
-        self.get_debugger().log(f"{key} enregistré dans DataBus")
+        self.get_debugger().log("%s enregistré dans DataBus", key)
 
     def remove(self, key: DataBusKey):
         if self.has(key):
             del self._store[key]
-            self.get_debugger().log(f"{key} a été supprimé du DataBus")
+            self.get_debugger().log("%s a été supprimé du DataBus", key)
         else:
             self.get_debugger().warning(
-                f"{key} ne peut pas être supprimé car il n'existe pas"
+                "%s ne peut pas être supprimé car il n'existe pas", key
             )
 
     def get(self, key: DataBusKey) -> Any:
@@ -27,7 +27,7 @@ class DataBus:
                 raise RuntimeError(f"{key} non enregistré dans DataBus")
             return self._store[key]
         except:
-            self.get_debugger().warning(f"{key} non trouvé dans DataBus")
+            self.get_debugger().warning("%s non trouvé dans DataBus", key)
             return None
 
     def has(self, key: DataBusKey) -> bool:
@@ -36,10 +36,10 @@ class DataBus:
     def replace(self, key: DataBusKey, instance: Any):
         if self.has(key):
             self._store[key] = instance
-            self.get_debugger().log(f"{key} remplacé dans DataBus")
+            self.get_debugger().log("%s remplacé dans DataBus", key)
         else:
             self.get_debugger().warning(
-                f"{key} non trouvé dans DataBus pour le remplacer"
+                "%s non trouvé dans DataBus pour le remplacer", key
             )
 
     def get_debugger(self) -> Debugger:
@@ -9,12 +9,18 @@ class Debugger:
         self.enable_warn = enable_warn
         self.enable_error = enable_error
 
-    def log(self, message):
+    def log(self, message, *args):
+        # Arguments are %-formatted only when logging is on, so per-frame
+        # callers pay nothing for disabled messages
         if self.enable_log:
+            if args:
+                message = message % args
             print(f"[DEBUG]: {message}")
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         if self.enable_warn:
+            if args:
+                message = message % args
             print(f"[WARNING]: {message}")
 
     def error(self, message):
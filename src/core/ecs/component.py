@@ -1,4 +1,5 @@
 class Component:
     """Base class for all components in the ECS architecture."""
 
-    pass
+    # Empty so that subclasses declaring __slots__ carry no instance __dict__
+    __slots__ = ()
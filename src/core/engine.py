@@ -5,6 +5,7 @@ import os
 
 from ai.world_perception import WorldPerception
 from components.gameplay.attack import Attack
+from components.gameplay.target import Target
 from config.ai_mapping import IA_MAP_JCJ
 from core.data_bus import DATA_BUS
 from core.accessors import (
@@ -388,6 +389,7 @@ def reset():
     DATA_BUS.remove(DataBusKey.ECONOMY_SYSTEM)
 
     esper.clear_database()
+    Target.clear_index()
     esper.clear_cache()
     esper.clear_dead_entities()
     esper._processors = []
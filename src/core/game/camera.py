@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from components.base.position import Position
 
 
@@ -121,6 +123,24 @@ class Camera:
             y - self.y
         ) * self.zoom_factor + self.offset_y
 
+    def apply_many(self, positions: Iterable[Position]) -> list[tuple[float, float]]:
+        """
+        Convert several world positions to screen coordinates in one call.
+
+        Args:
+            positions (Iterable[Position]): Objects with world x and y attributes.
+
+        Returns:
+            list[tuple[float, float]]: Transformed (x, y) screen coordinates.
+        """
+        cam_x, cam_y = self.x, self.y
+        zoom = self.zoom_factor
+        offset_x, offset_y = self.offset_x, self.offset_y
+        return [
+            ((pos.x - cam_x) * zoom + offset_x, (pos.y - cam_y) * zoom + offset_y)
+            for pos in positions
+        ]
+
     def apply_position(self, position: Position) -> Position:
         """
         Convert a Position component from world to screen coordinates.
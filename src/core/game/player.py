@@ -4,6 +4,7 @@ from core.ecs.component import Component
 
 
 class Player(object):
+    __slots__ = ("team_number", "money", "bastion", "spawn_position", "color")
 
     def __init__(
         self,
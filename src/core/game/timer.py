@@ -21,7 +21,7 @@ class Timer:
             self.paused = True
             self.pause_start = time.perf_counter()
         else:
-            get_debugger().warning(f"{self.timer_name} est déjà en pause")
+            get_debugger().warning("%s est déjà en pause", self.timer_name)
 
     def resume(self):
         """
@@ -34,7 +34,7 @@ class Timer:
             self.elapsed_paused += time.perf_counter() - self.pause_start
             self.pause_start = 0.0
         else:
-            get_debugger().warning(f"{self.timer_name} est déjà en pause")
+            get_debugger().warning("%s est déjà en pause", self.timer_name)
 
     def elapsed_ms(self):
         """
@@ -10,14 +10,13 @@ class EntityFactory:
 
     @staticmethod
     def create(*components: tuple[Component]) -> int:
-        entity = esper.create_entity()
+        copies = []
         for component in components:
             try:
                 component = copy.deepcopy(component)
             except:
-                get_debugger().error(
-                    f"Failed to copy component {component} for unit {entity}"
-                )
-                components.append(component)
-            esper.add_component(entity, component)
-        return entity
+                # Fall back to sharing the original instance
+                get_debugger().error(f"Failed to copy component {component}")
+            copies.append(component)
+        # Register every component in one call rather than one add_component each
+        return esper.create_entity(*copies)
@@ -16,9 +16,22 @@ import esper
 from components.base.health import Health
 from components.base.position import Position
 from components.gameplay.target import Target
-from components.base.team import Team
 from enums.entity.entity_type import EntityType
 
+# Target selection order: GHAST > CROSSBOWMAN > BRUTE, anything else last
+TARGET_PRIORITY = {
+    EntityType.GHAST: 3,
+    EntityType.CROSSBOWMAN: 2,
+    EntityType.BRUTE: 1,
+}
+
+# Base priority of threats to an allied BRUTE, by enemy type
+BRUTE_SUPPORT_PRIORITY = {
+    EntityType.GHAST: 150,  # Extremely high - GHAST is deadly
+    EntityType.CROSSBOWMAN: 100,  # High - ranged threat to BRUTE
+    EntityType.BRUTE: 80,  # Medium-high - melee threat
+}
+
 
 class BruteCoordination:
     """
@@ -32,95 +45,56 @@ class BruteCoordination:
         """Initialize with reference to main AI system for utility methods."""
         self.main = main_system
 
-    def _move_closer_to_brute(self, unit_ent, unit_pos, brute_pos, distance_to_brute):
-        """Move unit closer to BRUTE while maintaining tactical position."""
-        direction_to_brute_x = brute_pos.x - unit_pos.x
-        direction_to_brute_y = brute_pos.y - unit_pos.y
-        brute_length = (direction_to_brute_x**2 + direction_to_brute_y**2) ** 0.5
-
-        if brute_length > 0:
-            move_distance = min(50, distance_to_brute - 100)
-            direction_to_brute_x = direction_to_brute_x / brute_length * move_distance
-            direction_to_brute_y = direction_to_brute_y / brute_length * move_distance
-
-            new_x = unit_pos.x + direction_to_brute_x
-            new_y = unit_pos.y + direction_to_brute_y
+    def find_brute_in_combat_nearby(self, unit_ent, unit_pos, team_id):
+        """Find nearby BRUTE ally currently engaged in combat.
 
-            # Clamp to map bounds
-            new_x = max(32, min(new_x, 24 * 32 - 32))
-            new_y = max(32, min(new_y, 24 * 32 - 32))
+        Combat state comes from the per-tick BRUTE records, so only the
+        distance to each BRUTE is evaluated per unit.
+        """
+        for brute in self.get_all_ally_brutes(team_id):
+            brute_pos = brute["position"]
+            distance_to_brute = self.main._distance(unit_pos, brute_pos)
+            if (
+                distance_to_brute <= 120
+            ):  # REDUCED from 200 to 120 - must be closer to detect combat
+                if brute["in_combat"]:
+                    return {
+                        "entity": brute["entity"],
+                        "position": brute_pos,
+                        "enemy_count": brute["enemy_count"],
+                    }
+        return None
 
-            destination = Position(new_x, new_y)
-            self.main._smart_move_to(unit_ent, unit_pos, destination)
+    def get_all_ally_brutes(self, team_id):
+        """Get comprehensive information about all allied BRUTEs.
 
-    def _adjust_range_to_enemy(
-        self, unit_ent, unit_pos, enemy_pos, brute_pos, optimal_range
-    ):
-        """Adjust position to maintain optimal range to enemy while staying near BRUTE."""
-        direction_to_enemy_x = enemy_pos.x - unit_pos.x
-        direction_to_enemy_y = enemy_pos.y - unit_pos.y
-        enemy_length = (direction_to_enemy_x**2 + direction_to_enemy_y**2) ** 0.5
+        The records are identical for every unit of the team, so they are
+        built once per tick and shared through the main system's snapshot.
+        """
+        brutes = self.main._brute_infos_by_team.get(team_id)
+        if brutes is not None:
+            return brutes
 
-        if enemy_length > 0:
-            move_distance = min(
-                30, self.main._distance(unit_pos, enemy_pos) - optimal_range
+        brutes = []
+        all_crossbowmen = self.main._get_all_allied_crossbowmen(team_id)
+        for ent, pos in self.main._get_ally_brutes(team_id):
+            enemies_nearby = self.main._count_nearby_enemies(
+                pos, team_id, range_distance=120
             )
-            direction_to_enemy_x = direction_to_enemy_x / enemy_length * move_distance
-            direction_to_enemy_y = direction_to_enemy_y / enemy_length * move_distance
-
-            new_x = unit_pos.x + direction_to_enemy_x
-            new_y = unit_pos.y + direction_to_enemy_y
-
-            # Ensure we don't move too far from BRUTE
-            test_distance_to_brute = self.main._distance(
-                Position(new_x, new_y), brute_pos
+            brutes.append(
+                {
+                    "entity": ent,
+                    "position": pos,
+                    "in_combat": enemies_nearby > 0,
+                    "enemy_count": enemies_nearby,
+                    "supporting_crossbowmen": (
+                        self.main._count_crossbowmen_supporting_brute(
+                            pos, all_crossbowmen
+                        )
+                    ),
+                }
             )
-            if test_distance_to_brute <= 130:
-                destination = Position(new_x, new_y)
-                self.main._smart_move_to(unit_ent, unit_pos, destination)
-            else:
-                self.main._stop_movement(unit_ent)
-
-    def find_brute_in_combat_nearby(self, unit_ent, unit_pos, team_id):
-        """Find nearby BRUTE ally currently engaged in combat."""
-        for brute_ent, (brute_pos, brute_team, brute_type) in esper.get_components(
-            Position, Team, EntityType
-        ):
-            if brute_team.team_id == team_id and brute_type == EntityType.BRUTE:
-                distance_to_brute = self.main._distance(unit_pos, brute_pos)
-                if (
-                    distance_to_brute <= 120
-                ):  # REDUCED from 200 to 120 - must be closer to detect combat
-                    enemies_near_brute = self.main._count_nearby_enemies(
-                        brute_pos, team_id, range_distance=120
-                    )
-                    if enemies_near_brute > 0:
-                        return {
-                            "entity": brute_ent,
-                            "position": brute_pos,
-                            "enemy_count": enemies_near_brute,
-                        }
-        return None
-
-    def get_all_ally_brutes(self, team_id):
-        """Get comprehensive information about all allied BRUTEs."""
-        brutes = []
-        for ent, (team, entity_type, pos) in esper.get_components(
-            Team, EntityType, Position
-        ):
-            if team.team_id == team_id and entity_type == EntityType.BRUTE:
-                enemies_nearby = self.main._count_nearby_enemies(
-                    pos, team_id, range_distance=120
-                )
-                brutes.append(
-                    {
-                        "entity": ent,
-                        "position": pos,
-                        "in_combat": enemies_nearby > 0,
-                        "enemy_count": enemies_nearby,
-                        "supporting_crossbowmen": 0,  # Calculated later
-                    }
-                )
+        self.main._brute_infos_by_team[team_id] = brutes
         return brutes
 
     def find_brute_needing_support(self, ally_brutes, all_crossbowmen):
@@ -190,20 +164,27 @@ class BaseDefenseManager:
         return enemies_near_base > 0
 
     def count_enemies_attacking_base(self, team_id):
-        """Count enemy units currently threatening the base."""
-        base_pos = self.main._find_friendly_base(team_id)
-        if not base_pos:
-            return 0
+        """Count enemy units currently threatening the base.
+
+        The count is the same for every unit of the team, so it is computed
+        once per tick and kept with the main system's unit snapshot.
+        """
+        attackers = self.main._base_attackers_by_team.get(team_id)
+        if attackers is not None:
+            return attackers
 
         attackers = 0
-        for ent, (enemy_pos, enemy_team, enemy_type) in esper.get_components(
-            Position, Team, EntityType
-        ):
-            if enemy_team.team_id != team_id and enemy_type != EntityType.BASTION:
-                distance_to_base = self.main._distance(enemy_pos, base_pos)
-                if distance_to_base <= 200:  # Attack range
-                    attackers += 1
+        base_pos = self.main._find_friendly_base(team_id)
+        if base_pos:
+            for ent, enemy_pos, enemy_team_id, enemy_type in self.main._units_near(
+                self.main._get_enemy_grid(team_id), base_pos, 200
+            ):
+                if enemy_type is not EntityType.BASTION:
+                    distance_to_base = self.main._distance(enemy_pos, base_pos)
+                    if distance_to_base <= 200:  # Attack range
+                        attackers += 1
 
+        self.main._base_attackers_by_team[team_id] = attackers
         return attackers
 
     def calculate_defenders_needed(self, attackers_count):
@@ -223,42 +204,57 @@ class BaseDefenseManager:
             return 0
 
         defenders = 0
-        for ent, (ally_pos, ally_team, ally_type) in esper.get_components(
-            Position, Team, EntityType
+        for ent, ally_pos, ally_team_id, ally_type in self.main._units_near(
+            self.main._get_team_grid(team_id), base_pos, 150
         ):
-            if ally_team.team_id == team_id and ally_type != EntityType.BASTION:
+            if ally_type is not EntityType.BASTION:
                 distance_to_base = self.main._distance(ally_pos, base_pos)
                 if distance_to_base <= 150:  # Defensive range
                     defenders += 1
 
         return defenders
 
-    def find_base_threat(self, unit_pos, team_id):
-        """Find the most threatening enemy near our base."""
+    def get_base_threats(self, team_id):
+        """List living enemies within 250 px of the friendly base.
+
+        The list is the same for every unit of the team, so it is computed
+        once per tick and kept with the main system's unit snapshot.
+        """
+        threats = self.main._base_threats_by_team.get(team_id)
+        if threats is not None:
+            return threats
+
+        threats = []
         base_pos = self.main._find_friendly_base(team_id)
-        if not base_pos:
-            return None
+        if base_pos:
+            # Only enemies within 250 px of the base qualify, so query around it
+            enemy_grid = self.main._get_enemy_grid(team_id)
+            nearby = self.main._units_near(enemy_grid, base_pos, 250)
+            for ent_enemy, enemy_pos, enemy_team_id, enemy_type in nearby:
+                if enemy_type is not EntityType.BASTION:
+                    # Check if alive
+                    enemy_health = esper.try_component(ent_enemy, Health)
+                    if enemy_health is not None:
+                        if enemy_health.remaining <= 0:
+                            continue
+
+                    if self.main._distance(enemy_pos, base_pos) <= 250:
+                        threats.append((ent_enemy, enemy_pos, enemy_type))
+
+        self.main._base_threats_by_team[team_id] = threats
+        return threats
 
+    def find_base_threat(self, unit_pos, team_id):
+        """Find the most threatening enemy near our base."""
         closest_threat = None
         min_distance = float("inf")
 
-        for ent_enemy, (enemy_pos, enemy_team, enemy_type) in esper.get_components(
-            Position, Team, EntityType
-        ):
-            if enemy_team.team_id != team_id and enemy_type != EntityType.BASTION:
-                # Check if alive
-                if esper.has_component(ent_enemy, Health):
-                    enemy_health = esper.component_for_entity(ent_enemy, Health)
-                    if enemy_health.remaining <= 0:
-                        continue
-
-                distance_to_base = self.main._distance(enemy_pos, base_pos)
-                distance_to_self = self.main._distance(unit_pos, enemy_pos)
-
-                # Prioritize enemies threatening base
-                if distance_to_base <= 250 and distance_to_self < min_distance:
-                    min_distance = distance_to_self
-                    closest_threat = (ent_enemy, enemy_pos, enemy_type)
+        # Prioritize enemies threatening base, closest to this unit first
+        for threat in self.get_base_threats(team_id):
+            distance_to_self = self.main._distance(unit_pos, threat[1])
+            if distance_to_self < min_distance:
+                min_distance = distance_to_self
+                closest_threat = threat
 
         return closest_threat
 
@@ -280,34 +276,16 @@ class TargetPrioritizer:
         if not enemies_in_range:
             return None
 
-        # Separate by unit type for priority ordering
-        ghasts = [e for e in enemies_in_range if e[2] == EntityType.GHAST]
-        crossbowmen = [e for e in enemies_in_range if e[2] == EntityType.CROSSBOWMAN]
-        brutes = [e for e in enemies_in_range if e[2] == EntityType.BRUTE]
-
-        # Priority order: GHAST > CROSSBOWMAN > BRUTE
-        if ghasts:
-            return ghasts[0]
-        elif crossbowmen:
-            return crossbowmen[0]
-        elif brutes:
-            return brutes[0]
-        else:
-            return enemies_in_range[0]
+        # max() keeps the first of equally ranked enemies, so the earliest
+        # enemy of the highest priority type wins
+        return max(enemies_in_range, key=lambda e: TARGET_PRIORITY.get(e[2], 0))
 
     def calculate_brute_support_priority(
         self, target_type, distance_to_brute, distance_to_self
     ):
         """Calculate target priority specifically for BRUTE support scenarios."""
-        base_priority = 0
-
         # Higher priority for dangerous enemies
-        if target_type == EntityType.GHAST:
-            base_priority = 150  # Extremely high - GHAST is deadly
-        elif target_type == EntityType.CROSSBOWMAN:
-            base_priority = 100  # High - ranged threat to BRUTE
-        elif target_type == EntityType.BRUTE:
-            base_priority = 80  # Medium-high - melee threat
+        base_priority = BRUTE_SUPPORT_PRIORITY.get(target_type, 0)
 
         # Bonus for enemies very close to our BRUTE
         if distance_to_brute <= 80:
@@ -325,19 +303,14 @@ class TargetPrioritizer:
         closest_enemy = None
         min_distance = float("inf")
 
-        for target_ent, (target_pos, target_team, target_type) in esper.get_components(
-            Position, Team, EntityType
-        ):
-            if (
-                target_ent == unit_ent
-                or target_team.team_id == team_id
-                or target_type == EntityType.BASTION
-            ):
+        enemies = self.main._get_enemy_units(team_id)
+        for target_ent, target_pos, target_team_id, target_type in enemies:
+            if target_ent == unit_ent or target_type is EntityType.BASTION:
                 continue
 
             # Must be alive
-            if esper.has_component(target_ent, Health):
-                target_health = esper.component_for_entity(target_ent, Health)
+            target_health = esper.try_component(target_ent, Health)
+            if target_health is not None:
                 if target_health.remaining <= 0:
                     continue
 
@@ -353,14 +326,12 @@ class TargetPrioritizer:
         closest_ghast = None
         min_distance = float("inf")
 
-        for ent, (ghast_pos, ghast_team, ghast_type) in esper.get_components(
-            Position, Team, EntityType
-        ):
-            if ghast_team.team_id != team_id and ghast_type == EntityType.GHAST:
-                distance = self.main._distance(unit_pos, ghast_pos)
-                if distance <= range_distance and distance < min_distance:
-                    min_distance = distance
-                    closest_ghast = (ent, ghast_pos)
+        ghasts = self.main._get_enemy_units_of_type(team_id, EntityType.GHAST)
+        for ent, ghast_pos, ghast_team_id, ghast_type in ghasts:
+            distance = self.main._distance(unit_pos, ghast_pos)
+            if distance <= range_distance and distance < min_distance:
+                min_distance = distance
+                closest_ghast = (ent, ghast_pos)
 
         return closest_ghast
 
@@ -409,12 +380,16 @@ class MovementController:
         """Move unit closer to BRUTE while maintaining tactical position."""
         direction_to_brute_x = brute_pos.x - unit_pos.x
         direction_to_brute_y = brute_pos.y - unit_pos.y
-        brute_length = (direction_to_brute_x**2 + direction_to_brute_y**2) ** 0.5
+        brute_length_sq = (
+            direction_to_brute_x * direction_to_brute_x
+            + direction_to_brute_y * direction_to_brute_y
+        )
 
-        if brute_length > 0:
+        if brute_length_sq > 0:
             move_distance = min(50, distance_to_brute - 100)
-            direction_to_brute_x = direction_to_brute_x / brute_length * move_distance
-            direction_to_brute_y = direction_to_brute_y / brute_length * move_distance
+            scale = move_distance / math.sqrt(brute_length_sq)
+            direction_to_brute_x *= scale
+            direction_to_brute_y *= scale
 
             new_x = unit_pos.x + direction_to_brute_x
             new_y = unit_pos.y + direction_to_brute_y
@@ -432,24 +407,26 @@ class MovementController:
         """Adjust position to maintain optimal range to enemy while staying near BRUTE."""
         direction_to_enemy_x = enemy_pos.x - unit_pos.x
         direction_to_enemy_y = enemy_pos.y - unit_pos.y
-        enemy_length = (direction_to_enemy_x**2 + direction_to_enemy_y**2) ** 0.5
+        enemy_length_sq = (
+            direction_to_enemy_x * direction_to_enemy_x
+            + direction_to_enemy_y * direction_to_enemy_y
+        )
 
-        if enemy_length > 0:
+        if enemy_length_sq > 0:
             move_distance = min(
                 30, self.main._distance(unit_pos, enemy_pos) - optimal_range
             )
-            direction_to_enemy_x = direction_to_enemy_x / enemy_length * move_distance
-            direction_to_enemy_y = direction_to_enemy_y / enemy_length * move_distance
+            scale = move_distance / math.sqrt(enemy_length_sq)
+            direction_to_enemy_x *= scale
+            direction_to_enemy_y *= scale
 
             new_x = unit_pos.x + direction_to_enemy_x
             new_y = unit_pos.y + direction_to_enemy_y
 
             # Ensure we don't move too far from BRUTE
-            test_distance_to_brute = self.main._distance(
-                Position(new_x, new_y), brute_pos
-            )
+            destination = Position(new_x, new_y)
+            test_distance_to_brute = self.main._distance(destination, brute_pos)
             if test_distance_to_brute <= 130:
-                destination = Position(new_x, new_y)
                 self.main._smart_move_to(unit_ent, unit_pos, destination)
             else:
                 self.main._stop_movement(unit_ent)
@@ -459,9 +436,10 @@ class MovementController:
         retreat_x = unit_pos.x + (unit_pos.x - enemy_pos.x) * 0.3
         retreat_y = unit_pos.y + (unit_pos.y - enemy_pos.y) * 0.3
 
-        # Ensure retreat doesn't take us too far from BRUTE
-        test_distance_to_brute = self.main._distance(
-            Position(retreat_x, retreat_y), brute_pos
+        # Ensure retreat doesn't take us too far from BRUTE (Manhattan, as
+        # _distance, without allocating a throwaway Position)
+        test_distance_to_brute = abs(retreat_x - brute_pos.x) + abs(
+            retreat_y - brute_pos.y
         )
         if test_distance_to_brute <= 130:
             # Clamp to map bounds
@@ -481,11 +459,7 @@ class MovementController:
         base_pos = self.main._find_friendly_base(team_id)
         if not base_pos:
             # Fallback to team corner
-            if team_id == 2:
-                corner_x, corner_y = 20 * 32, 20 * 32
-            else:
-                corner_x, corner_y = 4 * 32, 4 * 32
-            base_pos = Position(corner_x, corner_y)
+            base_pos = self.main._get_fallback_base_position(team_id)
         # Place the defender directly on the bastion position. The game logic
         # expects defenders to be near/at the bastion so they can immediately
         # intercept attackers; this avoids stacking in a corner.
@@ -53,10 +53,10 @@ class CombatSystem(IteratingProcessor):
             return False
 
         # Check if target is in attack range
-        if not esper.has_component(ent_target_id, Position):
+        target_pos: Position = esper.try_component(ent_target_id, Position)
+        if target_pos is None:
             return False
 
-        target_pos: Position = esper.component_for_entity(ent_target_id, Position)
         distance_squared: int = ((target_pos.x - pos.x) ** 2) + (
             (target_pos.y - pos.y) ** 2
         )
@@ -103,10 +103,6 @@ class CombatSystem(IteratingProcessor):
                 target.target_entity_id = None
                 return
 
-            target_health: Health = esper.component_for_entity(
-                target.target_entity_id, Health
-            )
-
             target_pos: Position = esper.component_for_entity(
                 target.target_entity_id, Position
             )
@@ -143,23 +139,19 @@ class CombatSystem(IteratingProcessor):
         if not esper.entity_exists(attacker_id) or not esper.entity_exists(target_id):
             return
 
-        if not esper.has_component(attacker_id, Attack) or not esper.has_component(
-            target_id, Health
-        ):
+        atk: Attack = esper.try_component(attacker_id, Attack)
+        target_health: Health = esper.try_component(target_id, Health)
+        if atk is None or target_health is None:
             return
 
-        atk: Attack = esper.component_for_entity(attacker_id, Attack)
-        target_health: Health = esper.component_for_entity(target_id, Health)
-
         target_health.remaining = max(0, target_health.remaining - atk.damage)
 
         self.last_hit[attacker_id] = 0
 
         if target_health.remaining == 0:
             team = esper.component_for_entity(attacker_id, Team)
-            cost_amount = 0
-            if esper.has_component(target_id, Cost):
-                cost_amount = (esper.component_for_entity(target_id, Cost)).amount
+            cost = esper.try_component(target_id, Cost)
+            cost_amount = cost.amount if cost is not None else 0
 
             get_event_bus().emit(DeathEvent(team, target_id, cost_amount))
         else:
@@ -76,12 +76,14 @@ class FireballSystem(IteratingProcessor):
 
         dx = fireball.target_pos.x - position.x
         dy = fireball.target_pos.y - position.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        distance_sq = dx * dx + dy * dy
 
-        if distance < 5:
+        if distance_sq < 25:
             esper.delete_entity(ent)
             return
 
+        distance = math.sqrt(distance_sq)
+
         # Normalisation
         if distance > 0:
             nx = dx / distance
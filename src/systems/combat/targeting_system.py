@@ -31,6 +31,27 @@ class TargetingSystem(IteratingProcessor):
 
     def __init__(self):
         super().__init__(Position, Attack, Team)
+        self._living_units = []
+
+    def process(self, dt):
+        """
+        Gather living units once, then let every attacker pick a target.
+
+        Args:
+            dt: Time passed since last frame
+        """
+        # Liveness, team and type do not change while targets are assigned,
+        # so each attacker only has to test range and authorisation
+        living_units = []
+        for ent, (pos, team) in esper.get_components(Position, Team):
+            health = esper.try_component(ent, Health)
+            if health is not None and health.remaining > 0:
+                living_units.append(
+                    (ent, pos, team.team_id, self._get_entity_type(ent))
+                )
+        self._living_units = living_units
+
+        super().process(dt)
 
     def process_entity(self, ent, dt, pos, attack, team):
         """
@@ -45,8 +66,8 @@ class TargetingSystem(IteratingProcessor):
         """
         # Check if current target is still good
         current_target = None
-        if esper.has_component(ent, Target):
-            target_comp = esper.component_for_entity(ent, Target)
+        target_comp = esper.try_component(ent, Target)
+        if target_comp is not None:
             if target_comp.target_entity_id and self._is_valid_target(
                 target_comp.target_entity_id, ent, team.team_id, pos, attack
             ):
@@ -57,14 +78,12 @@ class TargetingSystem(IteratingProcessor):
             new_target = self._find_closest_enemy(ent, pos, attack, team.team_id)
 
             if new_target:
-                if esper.has_component(ent, Target):
-                    target_comp = esper.component_for_entity(ent, Target)
+                if target_comp is not None:
                     target_comp.target_entity_id = new_target
                 else:
                     esper.add_component(ent, Target(new_target))
             else:
-                if esper.has_component(ent, Target):
-                    target_comp = esper.component_for_entity(ent, Target)
+                if target_comp is not None:
                     target_comp.target_entity_id = None
 
     def _is_valid_target(
@@ -87,19 +106,13 @@ class TargetingSystem(IteratingProcessor):
             return False
 
         # Must be alive
-        if esper.has_component(target_id, Health):
-            health = esper.component_for_entity(target_id, Health)
-            if health.remaining <= 0:
-                return False
-        else:
+        health = esper.try_component(target_id, Health)
+        if health is None or health.remaining <= 0:
             return False
 
         # Must be enemy team
-        if esper.has_component(target_id, Team):
-            team = esper.component_for_entity(target_id, Team)
-            if team.team_id == attacker_team_id:
-                return False
-        else:
+        team = esper.try_component(target_id, Team)
+        if team is None or team.team_id == attacker_team_id:
             return False
 
         # Must be able to attack the target
@@ -109,14 +122,12 @@ class TargetingSystem(IteratingProcessor):
             return False
 
         # Must be in attack range
-        if esper.has_component(target_id, Position):
-            target_pos = esper.component_for_entity(target_id, Position)
-            dx = target_pos.x - attacker_pos.x
-            dy = target_pos.y - attacker_pos.y
-            distance = (dx**2 + dy**2) ** 0.5
-            if distance > attack.range:
-                return False
-        else:
+        target_pos = esper.try_component(target_id, Position)
+        if target_pos is None:
+            return False
+        dx = target_pos.x - attacker_pos.x
+        dy = target_pos.y - attacker_pos.y
+        if dx * dx + dy * dy > attack.range * attack.range:
             return False
 
         return True
@@ -135,26 +146,17 @@ class TargetingSystem(IteratingProcessor):
             int: Closest enemy entity ID or None if no valid target
         """
         closest_enemy = None
-        closest_distance = float("inf")
+        closest_distance_sq = float("inf")
+        range_sq = attack.range * attack.range
         attacker_type = self._get_entity_type(attacker)
 
-        for target_ent, (target_pos, target_team) in esper.get_components(
-            Position, Team
-        ):
+        # Dead units are already left out of the per-frame list
+        for target_ent, target_pos, target_team_id, target_type in self._living_units:
             # Skip allies and self
-            if target_ent == attacker or target_team.team_id == attacker_team_id:
-                continue
-
-            # Must be alive
-            if not esper.has_component(target_ent, Health):
-                continue
-
-            target_health = esper.component_for_entity(target_ent, Health)
-            if target_health.remaining <= 0:
+            if target_ent == attacker or target_team_id == attacker_team_id:
                 continue
 
             # check if it can attack the target
-            target_type = self._get_entity_type(target_ent)
             if not self._can_attack_target(attacker_type, target_type):
                 # if attacker_type and target_type:
                 #     print(
@@ -165,12 +167,12 @@ class TargetingSystem(IteratingProcessor):
                 # Calculate distance
             dx = target_pos.x - attacker_pos.x
             dy = target_pos.y - attacker_pos.y
-            distance = (dx**2 + dy**2) ** 0.5
+            distance_sq = dx * dx + dy * dy
 
             # Check if in range and closer than current best
-            if distance <= attack.range and distance < closest_distance:
+            if distance_sq <= range_sq and distance_sq < closest_distance_sq:
                 closest_enemy = target_ent
-                closest_distance = distance
+                closest_distance_sq = distance_sq
 
         return closest_enemy
 
@@ -186,18 +188,11 @@ class TargetingSystem(IteratingProcessor):
         """
 
         try:
-            components = esper.components_for_entity(entity_id)
-
-            # search for the EntityType component
-            for component in components:
-                if isinstance(component, EntityType) and hasattr(
-                    EntityType, component.name
-                ):
-                    return component
-
-        except:
-            pass
-        return None
+            # EntityType members are stored under their class, one lookup
+            return esper.try_component(entity_id, EntityType)
+        except KeyError:
+            # Entity was deleted
+            return None
 
     def _can_attack_target(self, attacker_type, target_type):
         """
@@ -23,20 +23,22 @@ class FormationSystem(IteratingProcessor):
 
         if formation_type == TROOP_GRID:
             grid_size = int(math.ceil(math.sqrt(num_entities)))
+            half = (grid_size - 1) / 2
 
-            for i in range(num_entities):
-                row = i // grid_size
-                col = i % grid_size
-
-                offset_x = (col - (grid_size - 1) / 2) * spacing
-                offset_y = (row - (grid_size - 1) / 2) * spacing
+            # Each column / row coordinate is shared by a whole line of units
+            column_xs = [target_x + (col - half) * spacing for col in range(grid_size)]
+            row_ys = [target_y + (row - half) * spacing for row in range(grid_size)]
 
-                positions.append((target_x + offset_x, target_y + offset_y))
+            positions = [
+                (column_xs[i % grid_size], row_ys[i // grid_size])
+                for i in range(num_entities)
+            ]
 
         elif formation_type == TROOP_CIRCLE:
             radius = max(spacing, num_entities * 8)
+            tau = 2 * math.pi
             for i in range(num_entities):
-                angle = (i / num_entities) * 2 * math.pi
+                angle = (i / num_entities) * tau
                 pos_x = target_x + radius * math.cos(angle)
                 pos_y = target_y + radius * math.sin(angle)
                 positions.append((pos_x, pos_y))
@@ -25,6 +25,4 @@ class DeathEventHandler:
             esper.delete_entity(dead_entity_id)
 
         # Clear all targeting references to dead entity
-        for ent, target in esper.get_component(Target):
-            if target.target_entity_id == dead_entity_id:
-                target.target_entity_id = None
+        Target.release(dead_entity_id)
@@ -1,7 +1,6 @@
 import esper
 from core.ecs.event_bus import EventBus
-from events.event_input import EventInput
-from enums.input_actions import InputAction
+from events.debug_toggle_event import DebugToggleEvent
 from systems.pathfinding_system import PATHFINDING_SYSTEM_INSTANCE
 
 
@@ -13,17 +12,17 @@ class DebugEventHandler(esper.Processor):
     def __init__(self, pathfinding_system):
         super().__init__()
         self.pathfinding_system = pathfinding_system
-        # S'abonner aux événements DEBUG_TOGGLE
-        EventBus.get_event_bus().subscribe(EventInput, self._on_input_event)
+        # S'abonner uniquement aux événements DEBUG_TOGGLE, déjà filtrés par
+        # l'InputRouterSystem, plutôt qu'à tous les événements d'input
+        EventBus.get_event_bus().subscribe(DebugToggleEvent, self._on_debug_toggle)
 
-    def _on_input_event(self, event: EventInput):
-        """Callback appelé quand un événement d'input est émis."""
-        if event.action == InputAction.DEBUG_TOGGLE:
-            # Basculer le mode debug du pathfinding
-            if self.pathfinding_system:
-                self.pathfinding_system.toggle_debug()
-            else:
-                print("ERREUR: pathfinding_system est None!")
+    def _on_debug_toggle(self, event: DebugToggleEvent):
+        """Callback appelé quand l'utilisateur demande à basculer le mode debug."""
+        # Basculer le mode debug du pathfinding
+        if self.pathfinding_system:
+            self.pathfinding_system.toggle_debug()
+        else:
+            print("ERREUR: pathfinding_system est None!")
 
     def process(self, dt):
         """Pas besoin de traitement dans la boucle principale."""
@@ -1,10 +1,34 @@
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+
 import esper
 import pygame
 from systems.pathfinding_system import PATHFINDING_SYSTEM_INSTANCE
 from core.game.camera import CAMERA
-from core.accessors import get_event_bus
+from core.accessors import get_debugger, get_event_bus
 from events.resize_event import ResizeEvent
 
+# Nombre maximal de textes rendus gardés en cache
+TEXT_CACHE_SIZE = 128
+
+# Textes de debug affichés en colonne à gauche plutôt qu'à leur position
+LEFT_COLUMN_TEXT_RE = re.compile(r"Path found|FAILED|Entity|iterations")
+
+
+@dataclass(slots=True)
+class PathCacheEntry:
+    """Portion d'un chemin affichée pour une entité."""
+
+    path: list
+    start_index: int
+    end_index: int
+    current_index: int
+    total_waypoints: int
+    entity_position: tuple
+    last_update: int
+
 
 class DebugRenderSystem(esper.Processor):
     """
@@ -29,7 +53,7 @@ class DebugRenderSystem(esper.Processor):
         )
 
         # Cache des chemins actifs avec timestamps
-        self.active_paths = {}  # entity_id -> {path, current_waypoint, last_update}
+        self.active_paths = {}  # entity_id -> PathCacheEntry
 
         # Paramètres d'affichage configurables
         self.max_visible_waypoints = 4  # Nombre max de waypoints à afficher
@@ -45,6 +69,27 @@ class DebugRenderSystem(esper.Processor):
         self.destination_color = (100, 255, 100)  # Vert pour destination finale
         self.trail_color = (255, 0, 255)  # Magenta pour ligne directe
 
+        # Surfaces de texte déjà rendues : (texte, couleur) -> Surface
+        self._text_cache = OrderedDict()
+
+        # Panneau d'informations pré-composé, refait quand une ligne change
+        self._info_panel = None
+        self._info_panel_lines = None
+
+        # Waypoints pré-rendus (cercle + contour) : (rayon, couleur) -> Surface
+        self._waypoint_stamps = {}
+        self._waypoint_stamps_zoom = None
+
+        # Index des cases de lave par ligne : y -> xs triés
+        self._lava_by_row = {}
+        self._lava_map_key = None
+
+        # Overlay de lave pré-rendu (reconstruit si le zoom ou la carte change)
+        self._lava_cache_surface = None
+        self._lava_cache_origin = (0, 0)
+        self._lava_cache_tiles = (0, 0)
+        self._lava_cache_key = None
+
         # Subscribe to resize events
         get_event_bus().subscribe(ResizeEvent, self._on_resize)
 
@@ -58,15 +103,15 @@ class DebugRenderSystem(esper.Processor):
         """Configurer les paramètres d'affichage des chemins en temps réel."""
         if refresh_interval is not None:
             self.path_refresh_interval = max(0.5, refresh_interval)  # Minimum 0.5s
-            print(f"[DEBUG] Intervalle de refresh: {self.path_refresh_interval}s")
+            get_debugger().log("Intervalle de refresh: %ss", self.path_refresh_interval)
 
         if max_waypoints is not None:
             self.max_visible_waypoints = max(2, min(10, max_waypoints))  # Entre 2 et 10
-            print(f"[DEBUG] Waypoints visibles: {self.max_visible_waypoints}")
+            get_debugger().log("Waypoints visibles: %s", self.max_visible_waypoints)
 
         if show_trail is not None:
             self.show_entity_trail = show_trail
-            print(f"[DEBUG] Affichage trail: {'ON' if show_trail else 'OFF'}")
+            get_debugger().log("Affichage trail: %s", "ON" if show_trail else "OFF")
 
     def process(self, dt):
         # Utiliser la référence directe ou le global en fallback
@@ -75,6 +120,11 @@ class DebugRenderSystem(esper.Processor):
         if not pathfinder or not pathfinder.debug_mode:
             return
 
+        # Rien à dessiner si la fenêtre est réduite ou la zone de dessin vide
+        clip = self.screen.get_clip()
+        if not pygame.display.get_active() or clip.width == 0 or clip.height == 0:
+            return
+
         # Mettre à jour le timer de refresh
         self.path_refresh_timer += dt
         should_refresh_paths = self.path_refresh_timer >= self.path_refresh_interval
@@ -116,10 +166,10 @@ class DebugRenderSystem(esper.Processor):
                 current_index = getattr(path_request, "current_index", 0)
 
                 # Si nouvel index ou refresh forcé, mettre à jour le cache
+                cached = self.active_paths.get(entity)
                 if (
-                    entity not in self.active_paths
-                    or self.active_paths[entity].get("current_index", 0)
-                    != current_index
+                    cached is None
+                    or cached.current_index != current_index
                     or force_refresh
                 ):
 
@@ -135,7 +185,7 @@ class DebugRenderSystem(esper.Processor):
         for entity_id in entities_to_remove:
             del self.active_paths[entity_id]
             if force_refresh:
-                print(f"[DEBUG] Chemin terminé pour entité {entity_id}")
+                get_debugger().log("Chemin terminé pour entité %s", entity_id)
 
     def _update_path_cache(self, entity_id, path_request, position, current_index):
         """Mettre à jour le cache du chemin pour une entité."""
@@ -147,16 +197,16 @@ class DebugRenderSystem(esper.Processor):
         start_index = max(0, current_index - 1)  # Inclure le waypoint précédent
         end_index = min(total_waypoints, current_index + self.max_visible_waypoints)
 
-        visible_waypoints = path_request.path[start_index:end_index]
-
-        # Mettre à jour le cache
-        self.active_paths[entity_id] = {
-            "visible_waypoints": visible_waypoints,
-            "current_index": current_index,
-            "total_waypoints": total_waypoints,
-            "entity_position": (position.x, position.y),
-            "last_update": pygame.time.get_ticks(),
-        }
+        # Mettre à jour le cache (référence au chemin + bornes, sans copie)
+        self.active_paths[entity_id] = PathCacheEntry(
+            path=path_request.path,
+            start_index=start_index,
+            end_index=end_index,
+            current_index=current_index,
+            total_waypoints=total_waypoints,
+            entity_position=(position.x, position.y),
+            last_update=pygame.time.get_ticks(),
+        )
 
         # print(
         #    f"[DEBUG] Entité {entity_id}: affichage waypoints {start_index}-{end_index-1} sur {total_waypoints}"
@@ -164,102 +214,103 @@ class DebugRenderSystem(esper.Processor):
 
     def _draw_entity_path(self, entity_id, current_position):
         """Dessiner le chemin pour une entité spécifique."""
-        if entity_id not in self.active_paths:
+        path_data = self.active_paths.get(entity_id)
+        if path_data is None:
             return
 
-        path_data = self.active_paths[entity_id]
-        visible_waypoints = path_data["visible_waypoints"]
-        current_index = path_data["current_index"]
+        path = path_data.path
+        start_index = path_data.start_index
+        end_index = path_data.end_index
 
-        if len(visible_waypoints) < 2:
+        if end_index - start_index < 2:
             return
 
         zoom = CAMERA.zoom_factor
 
-        # Dessiner les segments du chemin
-        for i in range(len(visible_waypoints) - 1):
-            start_waypoint = visible_waypoints[i]
-            end_waypoint = visible_waypoints[i + 1]
-
-            # Appliquer la transformation de caméra
-            start_camera = CAMERA.apply(start_waypoint.x, start_waypoint.y)
-            end_camera = CAMERA.apply(end_waypoint.x, end_waypoint.y)
-
-            # Choisir la couleur selon la position dans le chemin
-            if i == 0:
-                # Segment actuel (du joueur au prochain waypoint)
-                color = self.current_color
-                thickness = max(2, int(4 * zoom))
-            else:
-                # Segments suivants
-                color = self.next_color
-                thickness = max(1, int(2 * zoom))
+        # Appliquer la transformation de caméra une seule fois par waypoint
+        camera_points = [
+            (int(camera_x), int(camera_y))
+            for camera_x, camera_y in CAMERA.apply_many(
+                islice(path, start_index, end_index)
+            )
+        ]
 
-            try:
-                pygame.draw.line(
+        # Dessiner les segments du chemin : le segment actuel (du joueur au
+        # prochain waypoint) puis tous les segments suivants en un seul appel
+        try:
+            pygame.draw.line(
+                self.screen,
+                self.current_color,
+                camera_points[0],
+                camera_points[1],
+                max(2, int(4 * zoom)),
+            )
+            if len(camera_points) > 2:
+                pygame.draw.lines(
                     self.screen,
-                    color,
-                    (int(start_camera[0]), int(start_camera[1])),
-                    (int(end_camera[0]), int(end_camera[1])),
-                    thickness,
+                    self.next_color,
+                    False,
+                    camera_points[1:],
+                    max(1, int(2 * zoom)),
                 )
-            except (ValueError, TypeError):
-                continue
+        except (ValueError, TypeError):
+            pass
+
+        # Les tampons ne dépendent que du zoom : les oublier s'il change
+        if zoom != self._waypoint_stamps_zoom:
+            self._waypoint_stamps.clear()
+            self._waypoint_stamps_zoom = zoom
+
+        # Taille et couleur de chaque sorte de waypoint, résolues une fois
+        get_stamp = self._get_waypoint_stamp
+        target_radius = max(3, int(6 * zoom))  # Prochain waypoint cible
+        destination_radius = max(2, int(5 * zoom))  # Destination finale visible
+        waypoint_radius = max(1, int(3 * zoom))  # Waypoints intermédiaires
+        target_stamp = get_stamp(target_radius, self.target_color)
+        destination_stamp = get_stamp(destination_radius, self.destination_color)
+        waypoint_stamp = get_stamp(waypoint_radius, self.waypoint_color)
 
         # Dessiner les waypoints
-        for i, waypoint in enumerate(visible_waypoints):
-            try:
-                waypoint_camera = CAMERA.apply(waypoint.x, waypoint.y)
-
-                # Taille du cercle selon l'importance
-                if i == 0:
-                    # Prochain waypoint cible
-                    radius = max(3, int(6 * zoom))
-                    color = self.target_color
-                elif i == len(visible_waypoints) - 1:
-                    # Destination finale visible
-                    radius = max(2, int(5 * zoom))
-                    color = self.destination_color
-                else:
-                    # Waypoints intermédiaires
-                    radius = max(1, int(3 * zoom))
-                    color = self.waypoint_color
-
-                pygame.draw.circle(
-                    self.screen,
-                    color,
-                    (int(waypoint_camera[0]), int(waypoint_camera[1])),
-                    radius,
-                )
-
-                # Ajouter un contour pour plus de visibilité
-                pygame.draw.circle(
-                    self.screen,
-                    (0, 0, 0),
-                    (int(waypoint_camera[0]), int(waypoint_camera[1])),
-                    radius + 1,
-                    1,
-                )
-            except (ValueError, TypeError):
-                continue
+        blit = self.screen.blit
+        last_index = len(camera_points) - 1
+        for i, (camera_x, camera_y) in enumerate(camera_points):
+            if i == 0:
+                radius, stamp = target_radius, target_stamp
+            elif i == last_index:
+                radius, stamp = destination_radius, destination_stamp
+            else:
+                radius, stamp = waypoint_radius, waypoint_stamp
+            blit(stamp, (camera_x - radius - 1, camera_y - radius - 1))
 
         # Ligne directe de l'entité vers le prochain waypoint
-        if visible_waypoints and self.show_entity_trail:
-            next_waypoint = visible_waypoints[0]
+        if self.show_entity_trail:
             entity_camera = CAMERA.apply(current_position.x, current_position.y)
-            waypoint_camera = CAMERA.apply(next_waypoint.x, next_waypoint.y)
 
             try:
                 pygame.draw.line(
                     self.screen,
                     self.trail_color,
                     (int(entity_camera[0]), int(entity_camera[1])),
-                    (int(waypoint_camera[0]), int(waypoint_camera[1])),
+                    camera_points[0],
                     max(1, int(2 * zoom)),
                 )
             except (ValueError, TypeError):
                 pass
 
+    def _get_waypoint_stamp(self, radius, color):
+        """Retourne le cercle d'un waypoint (avec son contour) pré-rendu."""
+        key = (radius, tuple(color))
+        stamp = self._waypoint_stamps.get(key)
+        if stamp is None:
+            size = 2 * radius + 3
+            center = (radius + 1, radius + 1)
+            stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, color, center, radius)
+            # Ajouter un contour pour plus de visibilité
+            pygame.draw.circle(stamp, (0, 0, 0), center, radius + 1, 1)
+            self._waypoint_stamps[key] = stamp
+        return stamp
+
     def _draw_debug_texts(self, pathfinder):
         """Dessiner les textes de debug."""
         debug_y_offset = (
@@ -270,13 +321,11 @@ class DebugRenderSystem(esper.Processor):
             try:
                 if len(text_info) >= 3:
                     text, position, color = text_info[:3]
-                    text_surface = self.font.render(str(text), True, color)
+                    text = str(text)
+                    text_surface = self._render_text(text, color)
 
                     # Positionner les textes de debug en colonne à gauche pour éviter l'encombrement
-                    if any(
-                        keyword in str(text)
-                        for keyword in ["Path found", "FAILED", "Entity", "iterations"]
-                    ):
+                    if LEFT_COLUMN_TEXT_RE.search(text):
                         self.screen.blit(text_surface, (10, debug_y_offset + i * 20))
                     else:
                         # Textes liés aux positions (garder leur position originale)
@@ -286,78 +335,155 @@ class DebugRenderSystem(esper.Processor):
             except (ValueError, TypeError):
                 continue
 
+    def _render_text(self, text, color):
+        """Rendre un texte en réutilisant la surface si elle est déjà en cache."""
+        key = (text, tuple(color))
+        text_cache = self._text_cache
+        text_surface = text_cache.get(key)
+        if text_surface is None:
+            text_surface = self.font.render(text, True, color)
+            text_cache[key] = text_surface
+            if len(text_cache) > TEXT_CACHE_SIZE:
+                text_cache.popitem(last=False)
+        else:
+            text_cache.move_to_end(key)
+        return text_surface
+
     def _draw_debug_info(self, pathfinder):
         """Afficher les informations générales de debug."""
-        debug_info = [
+        debug_info = (
             f"DEBUG MODE ACTIVE (F3 to toggle)",
             f"Active paths: {len(self.active_paths)}",
             f"Path refresh: {self.path_refresh_timer:.1f}s / {self.path_refresh_interval}s",
             f"Max waypoints shown: {self.max_visible_waypoints}",
-            f"Debug messages: {len([t for t in pathfinder.debug_texts if len(t) >= 4])}",
+            f"Debug messages: {sum(1 for t in pathfinder.debug_texts if len(t) >= 4)}",
             f"Terrain map size: {len(pathfinder.terrain_map)} tiles",
-        ]
+        )
+
+        if debug_info != self._info_panel_lines:
+            self._info_panel = self._build_info_panel(debug_info)
+            self._info_panel_lines = debug_info
+        self.screen.blit(self._info_panel, (10, 10))
 
-        for i, info in enumerate(debug_info):
-            color = (255, 255, 0) if i == 0 else (200, 200, 200)
-            text_surface = self.font.render(info, True, color)
-            self.screen.blit(text_surface, (10, 10 + i * 20))
+    def _build_info_panel(self, debug_info):
+        """Composer les lignes d'information dans une seule surface."""
+        text_surfaces = [
+            self._render_text(info, (255, 255, 0) if i == 0 else (200, 200, 200))
+            for i, info in enumerate(debug_info)
+        ]
+        panel = pygame.Surface(
+            (
+                max(text_surface.get_width() for text_surface in text_surfaces),
+                (len(text_surfaces) - 1) * 20 + text_surfaces[-1].get_height(),
+            ),
+            pygame.SRCALPHA,
+        )
+        for i, text_surface in enumerate(text_surfaces):
+            panel.blit(text_surface, (0, i * 20))
+        return panel
 
     def _draw_terrain_debug(self, pathfinder):
-        """Dessine des overlays pour montrer les zones non-walkable."""
+        """Dessine des overlays pour montrer les zones non-walkable.
+
+        Toutes les cases de lave sont dessinées une seule fois dans une surface
+        hors écran ; chaque frame ne blitte que la partie visible par la caméra.
+        """
         tile_size = pathfinder.tile_size
+        map_key = pathfinder.lava_cells
+        if map_key is not self._lava_map_key:
+            self._index_lava_tiles(pathfinder)
+            self._lava_map_key = map_key
 
-        # Debug info seulement au début
-        if not hasattr(self, "_debug_printed"):
-            # print(
-            #    f"DEBUG: Terrain map a {len(pathfinder.terrain_map)} cases, tile_size={tile_size}"
-            # )
-            lava_positions = [
-                (x, y)
-                for (x, y), terrain_type in pathfinder.terrain_map.items()
-                if terrain_type == "LAVA"
-            ]
-            # print(
-            #    f"DEBUG: {len(lava_positions)} zones de lave aux positions (premières): {lava_positions[:10]}"
-            # )
-            self._debug_printed = True
-
-        # Parcourir la carte terrain et marquer les zones de lave
-        for (x, y), terrain_type in pathfinder.terrain_map.items():
-            if terrain_type == "LAVA":
-                # Calculer les coordonnées pixel de base
-                pixel_x = x * tile_size
-                pixel_y = y * tile_size
-
-                # Appliquer la transformation de caméra
-                if CAMERA.is_visible(pixel_x, pixel_y, tile_size, tile_size):
-                    camera_pos = CAMERA.apply(pixel_x, pixel_y)
-                    zoom = CAMERA.zoom_factor
-                    scaled_tile_size = int(tile_size * zoom)
-
-                    # Debug: afficher quelques positions avec caméra
-                    if not hasattr(self, "_lava_debug_done"):
-                        # print(
-                        #    f"DEBUG LAVA avec caméra: ({x},{y}) -> base({pixel_x},{pixel_y}) -> caméra({camera_pos[0]},{camera_pos[1]})"
-                        # )
-                        if x == 7 and y == 3:  # Premier point de lave
-                            self._lava_debug_done = True
-
-                    # Créer une surface transparente avec zoom
-                    overlay = pygame.Surface(
-                        (scaled_tile_size, scaled_tile_size), pygame.SRCALPHA
-                    )
-                    overlay.fill((255, 0, 0, 80))  # Rouge avec alpha
-                    self.screen.blit(overlay, camera_pos)
-
-                    # Dessiner un contour rouge avec zoom
-                    pygame.draw.rect(
-                        self.screen,
-                        (255, 0, 0),
-                        (
-                            camera_pos[0],
-                            camera_pos[1],
-                            scaled_tile_size,
-                            scaled_tile_size,
-                        ),
-                        2,
-                    )
+        zoom = CAMERA.zoom_factor
+        cache_key = (map_key, tile_size, zoom)
+        if cache_key != self._lava_cache_key:
+            self._build_lava_cache(tile_size, zoom)
+            self._lava_cache_key = cache_key
+
+        if self._lava_cache_surface is None:
+            return
+
+        # Plage de cases visibles, limitée à la boîte englobante de la lave
+        origin_x, origin_y = self._lava_cache_origin
+        tx0, ty0, tx1, ty1 = self._camera_tile_bounds(tile_size)
+        min_tx, min_ty = origin_x // tile_size, origin_y // tile_size
+        max_tx = min_tx + self._lava_cache_tiles[0]
+        max_ty = min_ty + self._lava_cache_tiles[1]
+        tx0, ty0 = max(tx0, min_tx), max(ty0, min_ty)
+        tx1, ty1 = min(tx1, max_tx), min(ty1, max_ty)
+        if tx0 >= tx1 or ty0 >= ty1:
+            return
+
+        scale = tile_size * zoom
+        scaled_tile_size = int(scale)
+        left = int((tx0 - min_tx) * scale)
+        top = int((ty0 - min_ty) * scale)
+        area = pygame.Rect(
+            left,
+            top,
+            int((tx1 - 1 - min_tx) * scale) + scaled_tile_size - left,
+            int((ty1 - 1 - min_ty) * scale) + scaled_tile_size - top,
+        )
+        camera_pos = CAMERA.apply(tx0 * tile_size, ty0 * tile_size)
+        self.screen.blit(self._lava_cache_surface, camera_pos, area)
+
+    def _camera_tile_bounds(self, tile_size):
+        """Retourne la plage de cases visibles (tx0, ty0, tx1, ty1), fin exclue."""
+        view_w = CAMERA.width / CAMERA.zoom_factor
+        view_h = CAMERA.height / CAMERA.zoom_factor
+        return (
+            int(CAMERA.x // tile_size),
+            int(CAMERA.y // tile_size),
+            int((CAMERA.x + view_w) // tile_size) + 1,
+            int((CAMERA.y + view_h) // tile_size) + 1,
+        )
+
+    def _index_lava_tiles(self, pathfinder):
+        """Indexer par ligne les cases de lave déjà extraites par le pathfinder."""
+        lava_by_row = {}
+        for x, y in pathfinder.lava_cells:
+            lava_by_row.setdefault(y, []).append(x)
+        for xs in lava_by_row.values():
+            xs.sort()
+        self._lava_by_row = lava_by_row
+
+    def _build_lava_cache(self, tile_size, zoom):
+        """Pré-rendre toutes les cases de lave indexées au zoom donné."""
+        lava_by_row = self._lava_by_row
+        if not lava_by_row:
+            self._lava_cache_surface = None
+            return
+
+        # Boîte englobante des cases de lave, en cases
+        min_x = min(xs[0] for xs in lava_by_row.values())
+        max_x = max(xs[-1] for xs in lava_by_row.values())
+        min_y = min(lava_by_row)
+        max_y = max(lava_by_row)
+
+        scale = tile_size * zoom
+        scaled_tile_size = int(scale)
+        surface = pygame.Surface(
+            (
+                int((max_x - min_x) * scale) + scaled_tile_size,
+                int((max_y - min_y) * scale) + scaled_tile_size,
+            ),
+            pygame.SRCALPHA,
+        )
+
+        # Une case de lave avec son contour, tamponnée en un seul appel blits
+        tile = pygame.Surface((scaled_tile_size, scaled_tile_size), pygame.SRCALPHA)
+        tile.fill((255, 0, 0, 80))  # Rouge avec alpha
+        pygame.draw.rect(tile, (255, 0, 0), tile.get_rect(), 2)  # Contour rouge
+
+        surface.blits(
+            [
+                (tile, (int((x - min_x) * scale), int((y - min_y) * scale)))
+                for y, xs in lava_by_row.items()
+                for x in xs
+            ],
+            doreturn=False,
+        )
+
+        self._lava_cache_tiles = (max_x - min_x + 1, max_y - min_y + 1)
+        self._lava_cache_surface = surface
+        self._lava_cache_origin = (min_x * tile_size, min_y * tile_size)
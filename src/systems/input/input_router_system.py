@@ -52,24 +52,16 @@ class InputRouterSystem(esper.Processor):
         }
 
     def handle_events(self, event: EventInput):
-        # Skip spawn actions - they are handled by HudManager
-        if event.action in [
-            InputAction.SPAWN_T1_CROSSBOWMAN,
-            InputAction.SPAWN_T1_BRUTE,
-            InputAction.SPAWN_T1_GHAST,
-            InputAction.SPAWN_T2_CROSSBOWMAN,
-            InputAction.SPAWN_T2_BRUTE,
-            InputAction.SPAWN_T2_GHAST,
-        ]:
+        # Spawn actions have no binding (they are handled by HudManager), so a
+        # single lookup skips them along with any unknown action
+        binding = self.action_bindings.get(event.action)
+        if binding is None:
             return
 
-        if event.action not in self.action_bindings:
-            return  # Ignore unknown actions
-
         if event.data:
-            get_event_bus().emit(self.action_bindings[event.action](event.data))
+            get_event_bus().emit(binding(event.data))
         else:
-            get_event_bus().emit(self.action_bindings[event.action])
+            get_event_bus().emit(binding)
 
     def process(self, dt):
         pass
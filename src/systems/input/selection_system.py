@@ -28,6 +28,9 @@ class SelectionSystem:
         self.selection_start = None
         self.selection_rect = None
         self.drag_threshold = 5  # Minimum pixels to consider it a drag
+        # Entities marked selected by this system, so clearing and listing the
+        # selection never walk every Selection component
+        self._selected: set[int] = set()
         get_event_bus().subscribe(SwitchEvent, self.on_switch)
         get_event_bus().subscribe(
             StartSelectEvent, lambda e: self.handle_mouse_down(e.pos)
@@ -63,9 +66,7 @@ class SelectionSystem:
             dx = mouse_pos[0] - self.selection_start[0]
             dy = mouse_pos[1] - self.selection_start[1]
 
-            distance = (dx**2 + dy**2) ** 0.5
-
-            if distance > self.drag_threshold:
+            if dx * dx + dy * dy > self.drag_threshold * self.drag_threshold:
                 self.is_dragging = True
 
                 start_x, start_y = CAMERA.apply(
@@ -107,17 +108,21 @@ class SelectionSystem:
         """
         self.clear_selection()
         closest_entity = None
-        closest_distance = float("inf")
+        closest_distance_sq = float("inf")
+
+        # Resolved once for the whole scan instead of once per unit
+        current_team = self.player_manager.get_current_player_number()
+        mouse_x, mouse_y = mouse_pos
 
         for ent, (pos, team) in esper.get_components(Position, Team):
             # Only select units from current player's team
-            if team.team_id == self.player_manager.get_current_player_number():
-                dx = mouse_pos[0] - pos.x
-                dy = mouse_pos[1] - pos.y
-                distance = (dx**2 + dy**2) ** 0.5
+            if team.team_id == current_team:
+                dx = mouse_x - pos.x
+                dy = mouse_y - pos.y
+                distance_sq = dx * dx + dy * dy
 
-                if esper.has_component(ent, Collider):
-                    collider = esper.component_for_entity(ent, Collider)
+                collider = esper.try_component(ent, Collider)
+                if collider is not None:
                     left = pos.x - collider.width // 2
                     top = pos.y - collider.height // 2
                     entity_rect = pygame.Rect(
@@ -126,18 +131,14 @@ class SelectionSystem:
 
                     if (
                         entity_rect.collidepoint(mouse_pos)
-                        and distance < closest_distance
+                        and distance_sq < closest_distance_sq
                     ):
                         closest_entity = ent
-                        closest_distance = distance
+                        closest_distance_sq = distance_sq
 
         # Mark closest entity as selected
         if closest_entity:
-            if esper.has_component(closest_entity, Selection):
-                selection = esper.component_for_entity(closest_entity, Selection)
-                selection.is_selected = True
-            else:
-                esper.add_component(closest_entity, Selection(True))
+            self._mark_selected(closest_entity)
 
     def select_entities_in_rect(self):
         """
@@ -151,18 +152,37 @@ class SelectionSystem:
 
         self.clear_selection()
 
+        # Resolved once for the whole scan instead of once per unit
+        current_team = self.player_manager.get_current_player_number()
+        collidepoint = self.selection_rect.collidepoint
+        cam_x, cam_y = CAMERA.x, CAMERA.y
+        zoom = CAMERA.zoom_factor
+        offset_x, offset_y = CAMERA.offset_x, CAMERA.offset_y
+
         for ent, (pos, team, velocity) in esper.get_components(
             Position, Team, Velocity
         ):
             # Only select units from current player's team
-            if team.team_id == self.player_manager.get_current_player_number():
-                pos = CAMERA.apply_position(pos)
-                if self.selection_rect.collidepoint(pos.x, pos.y):
-                    if esper.has_component(ent, Selection):
-                        selection = esper.component_for_entity(ent, Selection)
-                        selection.is_selected = True
-                    else:
-                        esper.add_component(ent, Selection(True))
+            if team.team_id == current_team:
+                # Same transform as CAMERA.apply_position, without the Position
+                screen_x = (pos.x - cam_x) * zoom + offset_x
+                screen_y = (pos.y - cam_y) * zoom + offset_y
+                if collidepoint(screen_x, screen_y):
+                    self._mark_selected(ent)
+
+    def _mark_selected(self, ent):
+        """
+        Mark an entity as selected and remember it.
+
+        Args:
+            ent: Entity to select
+        """
+        selection = esper.try_component(ent, Selection)
+        if selection is not None:
+            selection.is_selected = True
+        else:
+            esper.add_component(ent, Selection(True))
+        self._selected.add(ent)
 
     def clear_selection(self):
         """
@@ -171,8 +191,12 @@ class SelectionSystem:
         Args:
             world: Game world (not used but kept for consistency)
         """
-        for ent, selection in esper.get_component(Selection):
-            selection.is_selected = False
+        for ent in self._selected:
+            if esper.entity_exists(ent):
+                selection = esper.try_component(ent, Selection)
+                if selection is not None:
+                    selection.is_selected = False
+        self._selected.clear()
 
     def get_selected_entities(self):
         """
@@ -185,9 +209,14 @@ class SelectionSystem:
             list: Entity IDs that are currently selected
         """
         selected = []
-        for ent, selection in esper.get_component(Selection):
-            if selection.is_selected:
-                selected.append(ent)
+        for ent in sorted(self._selected):
+            if esper.entity_exists(ent):
+                selection = esper.try_component(ent, Selection)
+                if selection is not None and selection.is_selected:
+                    selected.append(ent)
+
+        # Forget entities that died or were deselected elsewhere (e.g. on arrival)
+        self._selected = set(selected)
         return selected
 
     def draw_selection_rect(self, screen):
@@ -251,7 +280,7 @@ class SelectionSystem:
                 formation_type=TROOP_GRID,  # you can change to TROOP_CIRCLE if needed
             )
 
-            for i, ent in enumerate(selected_entities):
-                if i < len(positions):
-                    target_x, target_y = positions[i]
-                    get_event_bus().emit(EventMoveTo(ent, target_x, target_y))
+            # zip stops at the shorter list, so extra units get no order
+            event_bus = get_event_bus()
+            for ent, (target_x, target_y) in zip(selected_entities, positions):
+                event_bus.emit(EventMoveTo(ent, target_x, target_y))
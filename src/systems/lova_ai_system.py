@@ -1,6 +1,7 @@
-"""crossbowman_ai_system_enemy
+"""lova_ai_system
 
-Enemy CROSSBOWMAN AI processor used for team 2. Provides tactical
+CROSSBOWMAN AI processor for every unit mapped to "LOVA" in the AI
+mapping, whichever team it belongs to. Provides tactical
 decision-making for ranged infantry: target selection, group tactics,
 base defense and BRUTE support. The system relies on helper classes
 for specialized behaviors (brute coordination, base defense, movement
@@ -8,7 +9,8 @@ and target prioritization).
 
 This module only contains documentation and helpers for maintainers.
 Runtime behavior is implemented in the methods of
-``CrossbowmanAISystemEnemy``.
+``LOVAAiSystem``. It is registered once by the engine; other AI
+processors skip units whose mapping is not theirs.
 
 Important concepts:
 - Force evaluation: point-based estimate of allied vs enemy power.
@@ -16,9 +18,19 @@ Important concepts:
 - BRUTE support: never abandon BRUTEs engaged in combat.
 """
 
+import heapq
 import math
+from collections import OrderedDict
+from operator import itemgetter
+
 import esper
-from components.ai import AIMemory, AIState, AIStateType, PathRequest
+from components.ai import (
+    AIMemory,
+    AIState,
+    AIStateType,
+    LOVAControlled,
+    PathRequest,
+)
 from components.gameplay.attack import Attack
 from components.base.health import Health
 from core.accessors import get_ai_mapping
@@ -39,6 +51,21 @@ from systems.ai_helpers import (
     MovementController,
 )
 
+# Maximum number of grid lines whose lava check result is remembered
+PATH_SAFETY_CACHE_SIZE = 1024
+
+# Squared distance (8 px) a unit must move before decisions are re-evaluated
+DECISION_MOVE_THRESHOLD_SQ = 8 * 8
+
+# Side in pixels of the spatial grid cells used for radius queries
+SPATIAL_CELL_SIZE = 150
+
+# Spawn corners and centre of the 24x24 map, in pixels. They are shared
+# destinations and must not be mutated.
+TEAM_1_CORNER = Position(4 * 32, 4 * 32)
+TEAM_2_CORNER = Position(20 * 32, 20 * 32)
+MAP_CENTER = Position(12 * 32, 12 * 32)
+
 
 class LOVAAiSystem(esper.Processor):
     """Processor that implements tactical behaviour for enemy crossbowmen.
@@ -55,7 +82,7 @@ class LOVAAiSystem(esper.Processor):
     """
 
     def __init__(self, pathfinding_system):
-        """Create a new CrossbowmanAISystemEnemy.
+        """Create a new LOVAAiSystem.
 
         Args:
             pathfinding_system: object providing terrain and pathfinding APIs.
@@ -64,6 +91,46 @@ class LOVAAiSystem(esper.Processor):
         self.pathfinding_system = pathfinding_system
         self.terrain_map = getattr(pathfinding_system, "terrain_map", {})
 
+        # Lava cells extracted from the terrain map, rebuilt when it changes
+        self._lava_cells = frozenset()
+        self._lava_map_key = None
+
+        # Terrain data shared by path checks, and line results kept between
+        # ticks until the terrain changes (least recently used are evicted)
+        self._path_safety_context = None
+        self._path_safety_results = OrderedDict()
+
+        # Per-tick snapshot of every unit as (entity, position, team id, type),
+        # with BASTION positions, BRUTE (entity, position) pairs, living
+        # non-BASTION (entity, position, type) targets, base attacker counts
+        # and BRUTE support records per team
+        self._frame_units = None
+        self._bases_by_team = {}
+        self._brutes_by_team = {}
+        self._targets_by_team = {}
+        self._target_grids = {}
+        self._units_by_team = {}
+        self._enemy_units_by_team = {}
+        self._units_by_team_type = {}
+        self._enemy_units_by_type = {}
+        self._team_grids = {}
+        self._enemy_grids = {}
+        self._base_attackers_by_team = {}
+        self._base_threats_by_team = {}
+        self._brute_infos_by_team = {}
+
+        # Decisions only depend on unit positions, liveness and the entity
+        # set. The world version is bumped whenever one of them changes, and
+        # units that already decided for the current version are skipped.
+        self._world_version = 0
+        self._world_anchors = {}
+        self._decision_versions = {}
+
+        # Units already checked against the AI mapping. Spawns always bump
+        # the world version, so screening only runs when it has moved.
+        self._screened_units = set()
+        self._screened_version = None
+
         # Initialize specialized helper classes for modular behavior
         self.brute_coordinator = BruteCoordination(self)
         self.base_defense = BaseDefenseManager(self)
@@ -71,6 +138,7 @@ class LOVAAiSystem(esper.Processor):
         self.movement_controller = MovementController(self)
 
         self.ai_mapping = get_ai_mapping()
+        self.event_bus = EventBus.get_event_bus()
 
     def process(self, dt):
         """Run AI update for all enemy crossbowmen.
@@ -87,46 +155,83 @@ class LOVAAiSystem(esper.Processor):
         # all selecting the same target.
         self._brute_assignment_counts = {}
 
-        # Add AI components to team 2 CROSSBOWMAN units
-        for ent, (team, entity_type, pos, attack, health) in esper.get_components(
-            Team, EntityType, Position, Attack, Health
-        ):
+        # Resolve terrain once for every direct path check of this tick
+        self._prepare_path_safety()
 
-            if self._is_lova_ai(entity_type, team.team_id):  # Enemy team
-                # Add AI components if missing
-                if not esper.has_component(ent, AIState):
-                    esper.add_component(ent, AIState())
-                if not esper.has_component(ent, AIMemory):
-                    esper.add_component(ent, AIMemory())
-                if not esper.has_component(ent, PathRequest):
-                    esper.add_component(ent, PathRequest())
-
-        # Pre-fill assignment counts from existing AIMemory to preserve
-        # previous frame assignments and avoid flapping.
-        for mem_ent, (memory,) in esper.get_components(AIMemory):
-            try:
-                assigned = memory.assigned_brute_id
-                if assigned:
-                    self._brute_assignment_counts[assigned] = (
-                        self._brute_assignment_counts.get(assigned, 0) + 1
-                    )
-            except Exception:
-                pass
+        # Snapshot units, bases and BRUTEs once for every scan of this tick
+        self._snapshot_units()
+
+        if self._screened_version != self._world_version:
+            self._screen_new_units()
+
+        # Only units tagged as LOVA controlled are visited from here on. The
+        # same join collects their decision inputs and pre-fills assignment
+        # counts from existing AIMemory to preserve previous frame
+        # assignments and avoid flapping.
+        assignment_counts = self._brute_assignment_counts
+        lova_units = []
+        rows = esper.get_components(
+            LOVAControlled, Team, Position, Attack, Health, AIMemory, PathRequest
+        )
+        for ent, (_, team, pos, attack, _, memory, path_request) in rows:
+            assigned = memory.assigned_brute_id
+            if assigned:
+                assignment_counts[assigned] = assignment_counts.get(assigned, 0) + 1
+            lova_units.append((ent, pos, attack, team.team_id, path_request))
 
         # Process all units with AI
-        for ent, (
-            team,
-            entity_type,
-            pos,
-            attack,
-            health,
-            ai_state,
-        ) in esper.get_components(Team, EntityType, Position, Attack, Health, AIState):
-            if not self._is_lova_ai(entity_type, team.team_id):
-                continue
+        decision_versions = {}
+        for ent, pos, attack, team_id, path_request in lova_units:
+            # Nothing this unit can observe changed since its last decision;
+            # units following an A* path still advance their waypoints
+            if self._decision_versions.get(ent) == self._world_version:
+                if not path_request.path:
+                    decision_versions[ent] = self._world_version
+                    continue
+
+            decision_versions[ent] = self._world_version
 
             # Smart AI logic with pathfinding
-            self._smart_ai_behavior(ent, pos, attack, team.team_id)
+            self._smart_ai_behavior(ent, pos, attack, team_id)
+
+        self._decision_versions = decision_versions
+
+    def _screen_new_units(self):
+        """Tag spawned LOVA units and attach their AI components.
+
+        Each unit is checked against the AI mapping once; units that are
+        not fully equipped yet are checked again on the next screening.
+        Components are attached after the scan, since every add clears the
+        esper query cache.
+        """
+        previous = self._screened_units
+        screened = set()
+        pending = []
+        for ent, _, team_id, entity_type in self._get_frame_units():
+            if ent in previous:
+                screened.add(ent)
+                continue
+            if not esper.has_components(ent, Attack, Health):
+                continue
+
+            screened.add(ent)
+            if not self._is_lova_ai(entity_type, team_id):
+                continue
+
+            # Add AI components if missing
+            if not esper.has_component(ent, AIState):
+                pending.append((ent, AIState()))
+            if not esper.has_component(ent, AIMemory):
+                pending.append((ent, AIMemory()))
+            if not esper.has_component(ent, PathRequest):
+                pending.append((ent, PathRequest()))
+            pending.append((ent, LOVAControlled()))
+
+        for ent, component in pending:
+            esper.add_component(ent, component)
+
+        self._screened_units = screened
+        self._screened_version = self._world_version
 
     def _is_lova_ai(self, entity_type: EntityType, team_id: int) -> bool:
         """
@@ -167,7 +272,7 @@ class LOVAAiSystem(esper.Processor):
             None
         """
         # Priority 1: Continue active pathfinding
-        if self._is_following_path(ent):
+        if self._is_following_path(ent, pos):
             return
 
         # Emergency priority: if our base is under attack, abandon everything
@@ -254,20 +359,19 @@ class LOVAAiSystem(esper.Processor):
         # FORCE EVALUATION: Strategic behavior selection
         self._execute_force_based_strategy(ent, pos, attack, team_id)
 
-    def _is_following_path(self, ent):
+    def _is_following_path(self, ent, pos):
         """Return True if the entity currently has an active A* PathRequest.
 
         Args:
             ent (int): entity id
+            pos (Position): current position component of the entity
 
         Returns:
             bool: True when a valid path is being followed, False otherwise.
         """
-        if esper.has_component(ent, PathRequest):
-            path_request = esper.component_for_entity(ent, PathRequest)
-            return self._follow_astar_path(
-                ent, esper.component_for_entity(ent, Position), path_request
-            )
+        path_request = esper.try_component(ent, PathRequest)
+        if path_request is not None:
+            return self._follow_astar_path(ent, pos, path_request)
         return False
 
     def _has_brute_allies(self, team_id):
@@ -299,13 +403,13 @@ class LOVAAiSystem(esper.Processor):
         """
         # Calculate force balance
         ally_force = self._calculate_ally_force(ent, team_id, pos)
-        enemy_force = self._calculate_enemy_force(team_id, pos, range_distance=300)
+        # Enemy force and the quick numeric count come from one enemy sweep
+        enemy_force, nearby_enemy_count = self._calculate_enemy_presence(
+            team_id, pos, force_range=300, count_range=400
+        )
         force_ratio = ally_force / max(enemy_force, 1)  # Avoid division by zero
         # Quick numeric check (allies vs enemies nearby) to prefer group assault
         nearby_ally_count = self._count_ally_crossbowmen(ent, team_id)
-        nearby_enemy_count = self._count_nearby_enemies(
-            pos, team_id, range_distance=400
-        )
 
         # If there are enemies and our allied force (point-based) is >= enemy force,
         # prefer to attack (group assault if enemies are nearby, otherwise seek enemies/base).
@@ -362,14 +466,10 @@ class LOVAAiSystem(esper.Processor):
 
         # Gather nearby enemy units
         nearby_enemies = []
-        for enemy_ent, (e_pos, e_team, e_type) in esper.get_components(
-            Position, Team, EntityType
+        for enemy_ent, e_pos, e_team_id, e_type in self._units_near(
+            self._get_enemy_grid(team_id), pos, RECRUIT_RADIUS
         ):
-            if (
-                e_team.team_id != team_id
-                and e_type != EntityType.BASTION
-                and self._is_alive(enemy_ent)
-            ):
+            if e_type is not EntityType.BASTION and self._is_alive(enemy_ent):
                 if self._distance(pos, e_pos) <= RECRUIT_RADIUS:
                     nearby_enemies.append((enemy_ent, e_pos, e_type))
 
@@ -381,11 +481,7 @@ class LOVAAiSystem(esper.Processor):
                 allies = self._get_closest_crossbowmen_to_target(
                     enemy_base_pos, team_id, self._count_ally_crossbowmen(ent, team_id)
                 )
-                for idx, ally_ent in enumerate(allies):
-                    try:
-                        ally_pos = esper.component_for_entity(ally_ent, Position)
-                    except Exception:
-                        continue
+                for idx, (ally_ent, ally_pos) in enumerate(allies):
                     angle = (idx / max(1, len(allies))) * 2 * math.pi
                     spread = 60 + (idx % 4) * 12
                     dest_x = enemy_base_pos.x + math.cos(angle) * spread
@@ -413,7 +509,7 @@ class LOVAAiSystem(esper.Processor):
         # Determine allies able to participate (within a larger radius)
         allies_info = self._get_all_allied_crossbowmen(team_id)
         participating = [
-            c["entity"]
+            (c["entity"], c["position"])
             for c in allies_info
             if self._distance(c["position"], enemy_pos) <= RECRUIT_RADIUS
         ]
@@ -425,17 +521,10 @@ class LOVAAiSystem(esper.Processor):
             )
 
         # Determine standoff distance based on attacker's range
-        safe_distance = (
-            attack.range * 24 * 0.85 if attack and hasattr(attack, "range") else 100
-        )
+        safe_distance = attack.range * 24 * 0.85 if attack is not None else 100
 
         # Issue orders: spread around the enemy at safe_distance
-        for idx, ally_ent in enumerate(participating):
-            try:
-                ally_pos = esper.component_for_entity(ally_ent, Position)
-            except Exception:
-                continue
-
+        for idx, (ally_ent, ally_pos) in enumerate(participating):
             angle = (idx / max(1, len(participating))) * 2 * math.pi
             spread = 20 + (idx % 3) * 8
             dest_x = enemy_pos.x + math.cos(angle) * (safe_distance + spread)
@@ -446,11 +535,7 @@ class LOVAAiSystem(esper.Processor):
             )
 
             # Assign target and move
-            if not esper.has_component(ally_ent, Target):
-                esper.add_component(ally_ent, Target(enemy_ent))
-            else:
-                tcomp = esper.component_for_entity(ally_ent, Target)
-                tcomp.target_entity_id = enemy_ent
+            self._set_combat_target(ally_ent, enemy_ent)
 
             self._smart_move_to(ally_ent, ally_pos, destination)
 
@@ -486,7 +571,7 @@ class LOVAAiSystem(esper.Processor):
 
         if priority_targets:
             # Attack the highest priority threat to our BRUTE
-            best_target = max(priority_targets, key=lambda x: x[3])
+            best_target = max(priority_targets, key=itemgetter(3))
             target_info = (best_target[0], best_target[1], best_target[2])
 
             # Set combat target
@@ -515,14 +600,11 @@ class LOVAAiSystem(esper.Processor):
         """
         priority_targets = []
 
-        for target_ent, (target_pos, target_team, target_type) in esper.get_components(
-            Position, Team, EntityType
+        # Only enemies near the BRUTE can qualify, so query around it
+        for target_ent, target_pos, target_team_id, target_type in self._units_near(
+            self._get_enemy_grid(team_id), brute_pos, 150
         ):
-            if (
-                target_team.team_id != team_id
-                and target_type != EntityType.BASTION
-                and self._is_alive(target_ent)
-            ):
+            if target_type is not EntityType.BASTION and self._is_alive(target_ent):
 
                 distance_to_brute = self._distance(brute_pos, target_pos)
                 distance_to_self = self._distance(pos, target_pos)
@@ -552,10 +634,10 @@ class LOVAAiSystem(esper.Processor):
         Returns:
             None
         """
-        if not esper.has_component(ent, Target):
+        target_comp = esper.try_component(ent, Target)
+        if target_comp is None:
             esper.add_component(ent, Target(target_ent))
         else:
-            target_comp = esper.component_for_entity(ent, Target)
             target_comp.target_entity_id = target_ent
 
     def _maintain_brute_support_position(self, ent, pos, brute_pos):
@@ -600,11 +682,12 @@ class LOVAAiSystem(esper.Processor):
         """
         direction_x = pos.x - brute_pos.x
         direction_y = pos.y - brute_pos.y
-        length = (direction_x**2 + direction_y**2) ** 0.5
+        length_sq = direction_x * direction_x + direction_y * direction_y
 
-        if length > 0:
-            direction_x = direction_x / length * target_distance
-            direction_y = direction_y / length * target_distance
+        if length_sq > 0:
+            scale = target_distance / math.sqrt(length_sq)
+            direction_x *= scale
+            direction_y *= scale
 
             new_x = brute_pos.x + direction_x
             new_y = brute_pos.y + direction_y
@@ -700,36 +783,32 @@ class LOVAAiSystem(esper.Processor):
             # end up farther than max_allowed_distance_from_base from the base.
             direction_x = enemy_pos.x - pos.x
             direction_y = enemy_pos.y - pos.y
-            length = (direction_x**2 + direction_y**2) ** 0.5
+            length_sq = direction_x * direction_x + direction_y * direction_y
 
-            if length > 0:
+            if length_sq > 0:
                 move_distance = min(40, distance_to_enemy - optimal_range)
-                direction_x = direction_x / length * move_distance
-                direction_y = direction_y / length * move_distance
+                scale = move_distance / math.sqrt(length_sq)
+                direction_x *= scale
+                direction_y *= scale
 
                 new_x = pos.x + direction_x
                 new_y = pos.y + direction_y
 
                 # If moving there would place us too far from base, clamp to a point
                 # on the vector from base to the candidate within allowed radius.
-                test_distance_to_base = self._distance(Position(new_x, new_y), base_pos)
+                candidate = Position(new_x, new_y)
+                test_distance_to_base = self._distance(candidate, base_pos)
                 if test_distance_to_base <= max_allowed_distance_from_base:
-                    destination = Position(new_x, new_y)
-                    self._smart_move_to(ent, pos, destination)
+                    self._smart_move_to(ent, pos, candidate)
                 else:
                     # Clamp the destination to max_allowed_distance_from_base from base
                     vec_x = new_x - base_pos.x
                     vec_y = new_y - base_pos.y
-                    vec_len = (vec_x**2 + vec_y**2) ** 0.5
-                    if vec_len > 0:
-                        clamp_x = (
-                            base_pos.x
-                            + vec_x / vec_len * max_allowed_distance_from_base
-                        )
-                        clamp_y = (
-                            base_pos.y
-                            + vec_y / vec_len * max_allowed_distance_from_base
-                        )
+                    vec_len_sq = vec_x * vec_x + vec_y * vec_y
+                    if vec_len_sq > 0:
+                        scale = max_allowed_distance_from_base / math.sqrt(vec_len_sq)
+                        clamp_x = base_pos.x + vec_x * scale
+                        clamp_y = base_pos.y + vec_y * scale
                         destination = Position(
                             max(32, min(clamp_x, 24 * 32 - 32)),
                             max(32, min(clamp_y, 24 * 32 - 32)),
@@ -751,10 +830,7 @@ class LOVAAiSystem(esper.Processor):
         Returns:
             Position: a reasonable map coordinate for the team's base area
         """
-        if team_id == 2:
-            return Position(20 * 32, 20 * 32)
-        else:
-            return Position(4 * 32, 4 * 32)
+        return TEAM_2_CORNER if team_id == 2 else TEAM_1_CORNER
 
     def _defend_base_actively(self, ent, pos, team_id):
         """Maintain defensive posture near base and engage nearby threats.
@@ -791,8 +867,8 @@ class LOVAAiSystem(esper.Processor):
 
         # Proactive scan: if this unit has an Attack component, try to engage
         # any enemies that wander into effective range.
-        if esper.has_component(ent, Attack):
-            attack_comp = esper.component_for_entity(ent, Attack)
+        attack_comp = esper.try_component(ent, Attack)
+        if attack_comp is not None:
             enemies_in_range = self._find_enemies_in_range(
                 ent, pos, attack_comp, team_id
             )
@@ -845,22 +921,25 @@ class LOVAAiSystem(esper.Processor):
         enemies = []
         attack_range = attack.range * 24  # Convert tiles to pixels
 
-        for target_ent, (target_pos, target_team, target_type) in esper.get_components(
-            Position, Team, EntityType
+        # Only enemy team 1 is targeted; bastions and dead units are
+        # already left out of the per-team target lists
+        if team_id == 1:
+            return enemies
+
+        # Only grid cells around the unit are scanned; the Manhattan range
+        # test is inlined since this runs for every unit
+        px, py = pos.x, pos.y
+        matches = []
+        for target_ent, target_pos, target_type, order in self._units_near(
+            self._get_target_grid(1), pos, attack_range
         ):
-            # Filter: exclude self, allies, bastions, and dead units
-            if (
-                target_ent == ent
-                or target_team.team_id == team_id
-                or target_team.team_id != 1  # Only target enemy team 1
-                or target_type == EntityType.BASTION
-                or not self._is_alive(target_ent)
-            ):
-                continue
+            if abs(target_pos.x - px) + abs(target_pos.y - py) <= attack_range:
+                matches.append((order, target_ent, target_pos, target_type))
 
-            # Check if target is within attack range
-            if self._distance(pos, target_pos) <= attack_range:
-                enemies.append((target_ent, target_pos, target_type))
+        # Restore snapshot order so target priority ties resolve as before
+        matches.sort()
+        for order, target_ent, target_pos, target_type in matches:
+            enemies.append((target_ent, target_pos, target_type))
 
         return enemies
 
@@ -873,8 +952,8 @@ class LOVAAiSystem(esper.Processor):
         Returns:
             bool
         """
-        if esper.has_component(ent, Health):
-            health = esper.component_for_entity(ent, Health)
+        health = esper.try_component(ent, Health)
+        if health is not None:
             return health.remaining > 0
         return True  # Assume alive if no health component
 
@@ -895,11 +974,12 @@ class LOVAAiSystem(esper.Processor):
             move_distance = min(40, distance_to_target - optimal_range)
             direction_x = target_pos.x - pos.x
             direction_y = target_pos.y - pos.y
-            length = (direction_x**2 + direction_y**2) ** 0.5
+            length_sq = direction_x * direction_x + direction_y * direction_y
 
-            if length > 0:
-                direction_x = direction_x / length * move_distance
-                direction_y = direction_y / length * move_distance
+            if length_sq > 0:
+                scale = move_distance / math.sqrt(length_sq)
+                direction_x *= scale
+                direction_y *= scale
 
                 new_x = pos.x + direction_x
                 new_y = pos.y + direction_y
@@ -957,7 +1037,10 @@ class LOVAAiSystem(esper.Processor):
             None
         """
         enemy_id, enemy_pos, enemy_type = enemy_info
-        distance = self._distance(pos, enemy_pos)
+        # Offset away from the enemy, shared by the range test and the retreat
+        away_x = pos.x - enemy_pos.x
+        away_y = pos.y - enemy_pos.y
+        distance = abs(away_x) + abs(away_y)
 
         # Set combat target
         self._set_combat_target(ent, enemy_id)
@@ -967,7 +1050,7 @@ class LOVAAiSystem(esper.Processor):
 
         if distance < optimal_range * 0.7:
             # Too close - retreat to optimal range
-            self._retreat_from_enemy_combat(ent, pos, enemy_pos)
+            self._retreat_from_enemy_combat(ent, pos, away_x, away_y)
         elif distance > optimal_range:
             # Too far - advance to optimal range
             self._smart_move_to(ent, pos, enemy_pos)
@@ -975,21 +1058,22 @@ class LOVAAiSystem(esper.Processor):
             # Perfect range - hold position and fire
             self._stop_movement(ent)
 
-    def _retreat_from_enemy_combat(self, ent, pos, enemy_pos):
-        """Step back a short distance from ``enemy_pos`` to regain range.
+    def _retreat_from_enemy_combat(self, ent, pos, away_x, away_y):
+        """Step back a short distance from an enemy to regain range.
 
         Args:
             ent (int): entity id
             pos (Position): current position
-            enemy_pos (Position): enemy position
+            away_x (float): x offset from the enemy to ``pos``
+            away_y (float): y offset from the enemy to ``pos``
 
         Returns:
             None
         """
         # Reduce how far we retreat to avoid excessive fleeing; back off just enough
         # to regain optimal ranged distance but stay in the fight.
-        retreat_x = pos.x + (pos.x - enemy_pos.x) * 0.3
-        retreat_y = pos.y + (pos.y - enemy_pos.y) * 0.3
+        retreat_x = pos.x + away_x * 0.3
+        retreat_y = pos.y + away_y * 0.3
 
         # Clamp to map bounds
         retreat_x = max(32, min(retreat_x, 24 * 32 - 32))
@@ -998,6 +1082,225 @@ class LOVAAiSystem(esper.Processor):
         destination = Position(retreat_x, retreat_y)
         self._smart_move_to(ent, pos, destination)
 
+    def _snapshot_units(self):
+        """Collect every unit once for all scans of the current tick.
+
+        Positions are kept by reference, so the snapshot stays accurate while
+        units move; only the entity set is frozen for the tick.
+        """
+        units = []
+        bases_by_team = {}
+        brutes_by_team = {}
+        targets_by_team = {}
+        anchors = self._world_anchors
+        world_changed = False
+        for ent, (pos, team, entity_type) in esper.get_components(
+            Position, Team, EntityType
+        ):
+            team_id = team.team_id
+            units.append((ent, pos, team_id, entity_type))
+
+            alive = self._is_alive(ent)
+            anchor = anchors.get(ent)
+            if (
+                anchor is None
+                or anchor[2] != alive
+                or (pos.x - anchor[0]) ** 2 + (pos.y - anchor[1]) ** 2
+                >= DECISION_MOVE_THRESHOLD_SQ
+            ):
+                world_changed = True
+
+            if entity_type is EntityType.BASTION:
+                bases_by_team.setdefault(team_id, pos)
+                continue
+            if entity_type is EntityType.BRUTE:
+                brutes_by_team.setdefault(team_id, []).append((ent, pos))
+
+            # Dead units are dropped here once instead of per attacker; the
+            # index keeps snapshot order when targets come back from the grid
+            if alive:
+                team_targets = targets_by_team.setdefault(team_id, [])
+                team_targets.append((ent, pos, entity_type, len(team_targets)))
+
+        # Spawned units show up as missing anchors, removed ones as a size gap
+        if world_changed or len(anchors) != len(units):
+            self._world_version += 1
+            self._world_anchors = {
+                ent: (pos.x, pos.y, self._is_alive(ent)) for ent, pos, _, _ in units
+            }
+
+        self._frame_units = units
+        self._units_by_team = {}
+        self._enemy_units_by_team = {}
+        self._units_by_team_type = {}
+        self._enemy_units_by_type = {}
+        self._team_grids = {}
+        self._enemy_grids = {}
+        self._base_attackers_by_team = {}
+        self._base_threats_by_team = {}
+        self._brute_infos_by_team = {}
+        self._bases_by_team = bases_by_team
+        self._brutes_by_team = brutes_by_team
+        self._targets_by_team = targets_by_team
+        self._target_grids = {}
+
+    def _get_frame_units(self):
+        """Return the unit snapshot, taking it first if none exists yet.
+
+        Returns:
+            list[tuple]: (entity_id, Position, team_id, EntityType) per unit
+        """
+        if self._frame_units is None:
+            self._snapshot_units()
+        return self._frame_units
+
+    def _get_team_units(self, team_id):
+        """Return the snapshot units belonging to ``team_id``.
+
+        Args:
+            team_id (int): team identifier
+
+        Returns:
+            list[tuple]: (entity_id, Position, team_id, EntityType) per unit
+        """
+        units = self._units_by_team.get(team_id)
+        if units is None:
+            units = [unit for unit in self._get_frame_units() if unit[2] == team_id]
+            self._units_by_team[team_id] = units
+        return units
+
+    def _get_enemy_units(self, team_id):
+        """Return the snapshot units that do not belong to ``team_id``.
+
+        Args:
+            team_id (int): own team identifier
+
+        Returns:
+            list[tuple]: (entity_id, Position, team_id, EntityType) per unit
+        """
+        units = self._enemy_units_by_team.get(team_id)
+        if units is None:
+            units = [unit for unit in self._get_frame_units() if unit[2] != team_id]
+            self._enemy_units_by_team[team_id] = units
+        return units
+
+    def _get_team_units_of_type(self, team_id, entity_type):
+        """Return the snapshot units of ``team_id`` that are ``entity_type``.
+
+        Args:
+            team_id (int): team identifier
+            entity_type (EntityType): unit type to keep
+
+        Returns:
+            list[tuple]: (entity_id, Position, team_id, EntityType) per unit
+        """
+        key = (team_id, entity_type)
+        units = self._units_by_team_type.get(key)
+        if units is None:
+            units = [
+                unit for unit in self._get_team_units(team_id) if unit[3] is entity_type
+            ]
+            self._units_by_team_type[key] = units
+        return units
+
+    def _get_enemy_units_of_type(self, team_id, entity_type):
+        """Return the enemy snapshot units of ``team_id`` that are ``entity_type``.
+
+        Args:
+            team_id (int): own team identifier
+            entity_type (EntityType): unit type to keep
+
+        Returns:
+            list[tuple]: (entity_id, Position, team_id, EntityType) per unit
+        """
+        key = (team_id, entity_type)
+        units = self._enemy_units_by_type.get(key)
+        if units is None:
+            units = [
+                unit
+                for unit in self._get_enemy_units(team_id)
+                if unit[3] is entity_type
+            ]
+            self._enemy_units_by_type[key] = units
+        return units
+
+    def _build_grid(self, units):
+        """Bucket units into square cells of ``SPATIAL_CELL_SIZE`` pixels.
+
+        Args:
+            units (list[tuple]): snapshot units to index
+
+        Returns:
+            dict: (cell_x, cell_y) -> list of snapshot units
+        """
+        grid = {}
+        for unit in units:
+            pos = unit[1]
+            cell = (int(pos.x // SPATIAL_CELL_SIZE), int(pos.y // SPATIAL_CELL_SIZE))
+            grid.setdefault(cell, []).append(unit)
+        return grid
+
+    def _units_near(self, grid, pos, range_distance):
+        """Yield the units of ``grid`` in cells overlapping a square around ``pos``.
+
+        The square has half-side ``range_distance``, so it contains every unit
+        within that Manhattan distance; callers still apply the exact test.
+
+        Args:
+            grid (dict): spatial grid built by ``_build_grid``
+            pos (Position): query center
+            range_distance (float): query radius in pixels
+
+        Yields:
+            tuple: (entity_id, Position, team_id, EntityType)
+        """
+        min_x = int((pos.x - range_distance) // SPATIAL_CELL_SIZE)
+        max_x = int((pos.x + range_distance) // SPATIAL_CELL_SIZE)
+        min_y = int((pos.y - range_distance) // SPATIAL_CELL_SIZE)
+        max_y = int((pos.y + range_distance) // SPATIAL_CELL_SIZE)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell_units = grid.get((cell_x, cell_y))
+                if cell_units:
+                    yield from cell_units
+
+    def _get_team_grid(self, team_id):
+        """Return the spatial grid of the units of ``team_id`` for this tick."""
+        grid = self._team_grids.get(team_id)
+        if grid is None:
+            grid = self._build_grid(self._get_team_units(team_id))
+            self._team_grids[team_id] = grid
+        return grid
+
+    def _get_enemy_grid(self, team_id):
+        """Return the spatial grid of the enemies of ``team_id`` for this tick."""
+        grid = self._enemy_grids.get(team_id)
+        if grid is None:
+            grid = self._build_grid(self._get_enemy_units(team_id))
+            self._enemy_grids[team_id] = grid
+        return grid
+
+    def _get_target_grid(self, team_id):
+        """Return the spatial grid of the living targets of ``team_id``."""
+        grid = self._target_grids.get(team_id)
+        if grid is None:
+            self._get_frame_units()
+            grid = self._build_grid(self._targets_by_team.get(team_id, ()))
+            self._target_grids[team_id] = grid
+        return grid
+
+    def _get_ally_brutes(self, team_id):
+        """Return the (entity, position) pairs of BRUTEs in a team.
+
+        Args:
+            team_id (int): team identifier
+
+        Returns:
+            list: BRUTE (entity, Position) pairs, empty if the team has none
+        """
+        self._get_frame_units()
+        return self._brutes_by_team.get(team_id, [])
+
     def _count_ally_brutes(self, team_id):
         """Return the number of BRUTE units for the specified team.
 
@@ -1007,11 +1310,7 @@ class LOVAAiSystem(esper.Processor):
         Returns:
             int
         """
-        count = 0
-        for ent, (team, entity_type) in esper.get_components(Team, EntityType):
-            if team.team_id == team_id and entity_type == EntityType.BRUTE:
-                count += 1
-        return count
+        return len(self._get_ally_brutes(team_id))
 
     def _coordinate_brute_support(self, ent, pos, attack, team_id, ally_brutes):
         """Choose and reserve a BRUTE to support, then provide support.
@@ -1025,23 +1324,16 @@ class LOVAAiSystem(esper.Processor):
             pos (Position): current position
             attack (Attack): attack component
             team_id (int): team identifier
-            ally_brutes (list): list of brute info dicts
+            ally_brutes (list): list of brute info dicts, support levels included
 
         Returns:
             None
         """
         # Ensure AIMemory exists and read assignment
-        if not esper.has_component(ent, AIMemory):
-            esper.add_component(ent, AIMemory())
-
-        memory = esper.component_for_entity(ent, AIMemory)
-
-        # Compute current support levels once
-        all_crossbowmen = self._get_all_allied_crossbowmen(team_id)
-        for brute in ally_brutes:
-            brute["supporting_crossbowmen"] = self._count_crossbowmen_supporting_brute(
-                brute["position"], all_crossbowmen
-            )
+        memory = esper.try_component(ent, AIMemory)
+        if memory is None:
+            memory = AIMemory()
+            esper.add_component(ent, memory)
 
         # If we already have an assigned brute and it's still valid, keep it
         if memory.assigned_brute_id:
@@ -1115,11 +1407,9 @@ class LOVAAiSystem(esper.Processor):
             list[dict]: each dict contains 'entity' and 'position'
         """
         crossbowmen = []
-        for crossbow_ent, (team, entity_type, crossbow_pos) in esper.get_components(
-            Team, EntityType, Position
-        ):
-            if team.team_id == team_id and entity_type == EntityType.CROSSBOWMAN:
-                crossbowmen.append({"entity": crossbow_ent, "position": crossbow_pos})
+        crossbows = self._get_team_units_of_type(team_id, EntityType.CROSSBOWMAN)
+        for crossbow_ent, crossbow_pos, unit_team_id, entity_type in crossbows:
+            crossbowmen.append({"entity": crossbow_ent, "position": crossbow_pos})
         return crossbowmen
 
     def _count_crossbowmen_supporting_brute(self, brute_pos, all_crossbowmen):
@@ -1205,10 +1495,10 @@ class LOVAAiSystem(esper.Processor):
         # Find enemies threatening the BRUTE
         priority_targets = []
 
-        for target_ent, (target_pos, target_team, target_type) in esper.get_components(
-            Position, Team, EntityType
+        for target_ent, target_pos, target_team_id, target_type in self._units_near(
+            self._get_enemy_grid(team_id), brute_pos, 120
         ):
-            if target_team.team_id != team_id and target_type != EntityType.BASTION:
+            if target_type is not EntityType.BASTION:
                 distance_to_brute = self._distance(brute_pos, target_pos)
                 distance_to_self = self._distance(pos, target_pos)
 
@@ -1226,8 +1516,7 @@ class LOVAAiSystem(esper.Processor):
 
         if priority_targets:
             # Attack highest priority target
-            priority_targets.sort(key=lambda x: x[3], reverse=True)
-            best_target = priority_targets[0]
+            best_target = max(priority_targets, key=itemgetter(3))
             target_info = (best_target[0], best_target[1], best_target[2])
 
             # Engage target while maintaining support position
@@ -1241,12 +1530,13 @@ class LOVAAiSystem(esper.Processor):
                 # Get closer to BRUTE
                 direction_x = brute_pos.x - pos.x
                 direction_y = brute_pos.y - pos.y
-                length = (direction_x**2 + direction_y**2) ** 0.5
+                length_sq = direction_x * direction_x + direction_y * direction_y
 
-                if length > 0:
+                if length_sq > 0:
                     move_distance = min(30, distance_to_brute - ideal_support_distance)
-                    direction_x = direction_x / length * move_distance
-                    direction_y = direction_y / length * move_distance
+                    scale = move_distance / math.sqrt(length_sq)
+                    direction_x *= scale
+                    direction_y *= scale
 
                     new_x = pos.x + direction_x
                     new_y = pos.y + direction_y
@@ -1277,11 +1567,11 @@ class LOVAAiSystem(esper.Processor):
         base_priority = 0
 
         # Base priority by unit type
-        if target_type == EntityType.GHAST:
+        if target_type is EntityType.GHAST:
             base_priority = 100  # Highest priority
-        elif target_type == EntityType.CROSSBOWMAN:
+        elif target_type is EntityType.CROSSBOWMAN:
             base_priority = 80  # High priority (ranged threat)
-        elif target_type == EntityType.BRUTE:
+        elif target_type is EntityType.BRUTE:
             base_priority = 60  # Medium priority
 
         # Bonus for enemies close to our BRUTE
@@ -1316,14 +1606,9 @@ class LOVAAiSystem(esper.Processor):
         if enemy_base:
             # Check if other crossbowmen are also attacking the base
             crossbowmen_near_base = 0
-            for crossbow_ent, (team, entity_type, crossbow_pos) in esper.get_components(
-                Team, EntityType, Position
-            ):
-                if (
-                    team.team_id == team_id
-                    and entity_type == EntityType.CROSSBOWMAN
-                    and crossbow_ent != ent
-                ):
+            crossbows = self._get_team_units_of_type(team_id, EntityType.CROSSBOWMAN)
+            for crossbow_ent, crossbow_pos, unit_team_id, entity_type in crossbows:
+                if crossbow_ent != ent:
                     distance_to_base = self._distance(crossbow_pos, enemy_base)
                     if distance_to_base <= 200:  # Others are attacking base
                         crossbowmen_near_base += 1
@@ -1336,7 +1621,7 @@ class LOVAAiSystem(esper.Processor):
         # Fallback: Look for enemy groups to attack
         enemies_in_range = self._find_enemies_in_range(ent, pos, attack, team_id)
         if enemies_in_range:
-            best_target = self._prioritize_targets(enemies_in_range)
+            best_target = self.target_prioritizer.prioritize_targets(enemies_in_range)
             self._attack_enemy(ent, pos, best_target, attack)
         else:
             # Move towards enemy territory to find targets
@@ -1344,10 +1629,7 @@ class LOVAAiSystem(esper.Processor):
                 self._smart_move_to(ent, pos, enemy_base)
             else:
                 # Fallback: move to enemy spawn area
-                if enemy_team_id == 1:
-                    target_pos = Position(4 * 32, 4 * 32)  # Top-left
-                else:
-                    target_pos = Position(20 * 32, 20 * 32)  # Bottom-right
+                target_pos = self._get_fallback_base_position(enemy_team_id)
                 self._smart_move_to(ent, pos, target_pos)
 
     def _count_ally_crossbowmen(self, current_ent, team_id):
@@ -1360,14 +1642,8 @@ class LOVAAiSystem(esper.Processor):
         Returns:
             int
         """
-        count = 0
-        for ent, (team, entity_type) in esper.get_components(Team, EntityType):
-            if (
-                ent != current_ent
-                and team.team_id == team_id
-                and entity_type == EntityType.CROSSBOWMAN
-            ):
-                count += 1
+        crossbowmen = self._get_team_units_of_type(team_id, EntityType.CROSSBOWMAN)
+        count = sum(1 for ent, _, _, _ in crossbowmen if ent != current_ent)
         return count + 1  # +1 for self
 
     def _count_nearby_enemies(self, pos, team_id, range_distance=200):
@@ -1382,11 +1658,12 @@ class LOVAAiSystem(esper.Processor):
             int
         """
         count = 0
-        for ent, (enemy_pos, enemy_team) in esper.get_components(Position, Team):
-            if enemy_team.team_id != team_id:
-                distance = self._distance(pos, enemy_pos)
-                if distance <= range_distance:
-                    count += 1
+        px, py = pos.x, pos.y
+        for ent, enemy_pos, enemy_team_id, enemy_type in self._units_near(
+            self._get_enemy_grid(team_id), pos, range_distance
+        ):
+            if abs(enemy_pos.x - px) + abs(enemy_pos.y - py) <= range_distance:
+                count += 1
         return count
 
     def _calculate_ally_force(self, current_ent, team_id, pos, range_distance=400):
@@ -1405,49 +1682,56 @@ class LOVAAiSystem(esper.Processor):
         """
         total_force = 0
 
-        for ent, (ally_pos, ally_team, ally_type) in esper.get_components(
-            Position, Team, EntityType
+        px, py = pos.x, pos.y
+        for ent, ally_pos, ally_team_id, ally_type in self._units_near(
+            self._get_team_grid(team_id), pos, range_distance
         ):
-            if ally_team.team_id == team_id:
-                # Check if ally is in reasonable range to help
-                distance = self._distance(pos, ally_pos)
-                if distance <= range_distance:
-                    if ally_type == EntityType.BRUTE:
-                        total_force += 3
-                    elif ally_type == EntityType.CROSSBOWMAN:
-                        total_force += 5
-                    elif ally_type == EntityType.GHAST:
-                        total_force += 8
+            # Check if ally is in reasonable range to help
+            if abs(ally_pos.x - px) + abs(ally_pos.y - py) <= range_distance:
+                if ally_type is EntityType.BRUTE:
+                    total_force += 3
+                elif ally_type is EntityType.CROSSBOWMAN:
+                    total_force += 5
+                elif ally_type is EntityType.GHAST:
+                    total_force += 8
 
         return total_force
 
-    def _calculate_enemy_force(self, team_id, pos, range_distance=300):
-        """Estimate enemy force nearby using the same point scale as allies.
+    def _calculate_enemy_presence(self, team_id, pos, force_range=300, count_range=400):
+        """Estimate nearby enemy force and count enemies in a single sweep.
+
+        Force uses the same point scale as allies and only includes enemies
+        within ``force_range``; the count includes every enemy unit within
+        ``count_range``.
 
         Args:
             team_id (int): own team id (enemies are the other team)
             pos (Position): reference position
-            range_distance (float): radius in pixels
+            force_range (float): radius in pixels for the force estimate
+            count_range (float): radius in pixels for the enemy count
 
         Returns:
-            int
+            tuple[int, int]: (summed force points, enemy count)
         """
         total_force = 0
+        count = 0
 
-        for ent, (enemy_pos, enemy_team, enemy_type) in esper.get_components(
-            Position, Team, EntityType
+        px, py = pos.x, pos.y
+        for ent, enemy_pos, enemy_team_id, enemy_type in self._units_near(
+            self._get_enemy_grid(team_id), pos, max(force_range, count_range)
         ):
-            if enemy_team.team_id != team_id:
-                distance = self._distance(pos, enemy_pos)
-                if distance <= range_distance:
-                    if enemy_type == EntityType.BRUTE:
-                        total_force += 3
-                    elif enemy_type == EntityType.CROSSBOWMAN:
-                        total_force += 5
-                    elif enemy_type == EntityType.GHAST:
-                        total_force += 8
+            distance = abs(enemy_pos.x - px) + abs(enemy_pos.y - py)
+            if distance <= count_range:
+                count += 1
+            if distance <= force_range:
+                if enemy_type is EntityType.BRUTE:
+                    total_force += 3
+                elif enemy_type is EntityType.CROSSBOWMAN:
+                    total_force += 5
+                elif enemy_type is EntityType.GHAST:
+                    total_force += 8
 
-        return total_force
+        return total_force, count
 
     def _find_nearest_ghast(self, pos, team_id, range_distance=400):
         """Return the closest enemy GHAST within ``range_distance``.
@@ -1463,14 +1747,13 @@ class LOVAAiSystem(esper.Processor):
         closest_ghast = None
         min_distance = float("inf")
 
-        for ent, (ghast_pos, ghast_team, ghast_type) in esper.get_components(
-            Position, Team, EntityType
+        for ent, ghast_pos, ghast_team_id, ghast_type in self._get_enemy_units_of_type(
+            team_id, EntityType.GHAST
         ):
-            if ghast_team.team_id != team_id and ghast_type == EntityType.GHAST:
-                distance = self._distance(pos, ghast_pos)
-                if distance <= range_distance and distance < min_distance:
-                    min_distance = distance
-                    closest_ghast = (ent, ghast_pos)
+            distance = self._distance(pos, ghast_pos)
+            if distance <= range_distance and distance < min_distance:
+                min_distance = distance
+                closest_ghast = (ent, ghast_pos)
 
         return closest_ghast
 
@@ -1488,13 +1771,12 @@ class LOVAAiSystem(esper.Processor):
             return 0
 
         defenders = 0
-        for ent, (ally_pos, ally_team, ally_type) in esper.get_components(
-            Position, Team, EntityType
+        for ent, ally_pos, ally_team_id, ally_type in self._get_team_units_of_type(
+            team_id, EntityType.CROSSBOWMAN
         ):
-            if ally_team.team_id == team_id and ally_type == EntityType.CROSSBOWMAN:
-                distance_to_base = self._distance(ally_pos, base_pos)
-                if distance_to_base <= 200:  # Within defensive range
-                    defenders += 1
+            distance_to_base = self._distance(ally_pos, base_pos)
+            if distance_to_base <= 200:  # Within defensive range
+                defenders += 1
 
         return defenders
 
@@ -1520,19 +1802,15 @@ class LOVAAiSystem(esper.Processor):
             return
 
         # Set GHAST as target
-        if not esper.has_component(ent, Target):
-            esper.add_component(ent, Target(ghast_ent))
-        else:
-            target_comp = esper.component_for_entity(ent, Target)
-            target_comp.target_entity_id = ghast_ent
+        self._set_combat_target(ent, ghast_ent)
 
         # Position between base and GHAST for intercept
         # Calculate optimal defensive position
         direction_x = ghast_pos.x - base_pos.x
         direction_y = ghast_pos.y - base_pos.y
-        length = (direction_x**2 + direction_y**2) ** 0.5
 
-        if length > 0:
+        # Only the sign matters here, so skip the square root
+        if direction_x * direction_x + direction_y * direction_y > 0:
             # Position 60% of the way from base to GHAST
             intercept_factor = 0.6
             intercept_x = base_pos.x + (direction_x * intercept_factor)
@@ -1571,11 +1849,7 @@ class LOVAAiSystem(esper.Processor):
         distance = self._distance(pos, ghast_pos)
 
         # Set GHAST as primary target with highest priority
-        if not esper.has_component(ent, Target):
-            esper.add_component(ent, Target(ghast_ent))
-        else:
-            target_comp = esper.component_for_entity(ent, Target)
-            target_comp.target_entity_id = ghast_ent
+        self._set_combat_target(ent, ghast_ent)
 
         # Maintain aggressive range for GHAST combat - get closer for better accuracy
         optimal_range = (
@@ -1612,21 +1886,18 @@ class LOVAAiSystem(esper.Processor):
         """
         brutes_in_combat = 0
 
-        for brute_ent, (brute_pos, brute_team, brute_type) in esper.get_components(
-            Position, Team, EntityType
-        ):
-            if brute_team.team_id == team_id and brute_type == EntityType.BRUTE:
-                # Check if BRUTE has enemies nearby (indicating combat)
-                enemies_nearby = self._count_nearby_enemies(
-                    brute_pos, team_id, range_distance=100
-                )
-                if enemies_nearby > 0:
-                    brutes_in_combat += 1
+        for brute_ent, brute_pos in self._get_ally_brutes(team_id):
+            # Check if BRUTE has enemies nearby (indicating combat)
+            enemies_nearby = self._count_nearby_enemies(
+                brute_pos, team_id, range_distance=100
+            )
+            if enemies_nearby > 0:
+                brutes_in_combat += 1
 
         return brutes_in_combat
 
     def _get_closest_crossbowmen_to_target(self, target_pos, team_id, count):
-        """Return up to ``count`` crossbowman entity ids closest to ``target_pos``.
+        """Return up to ``count`` crossbowmen closest to ``target_pos``.
 
         Args:
             target_pos (Position): reference position
@@ -1634,20 +1905,19 @@ class LOVAAiSystem(esper.Processor):
             count (int): maximum number of entities to return
 
         Returns:
-            list[int]
+            list[tuple]: (entity_id, Position) per crossbowman
         """
         crossbowmen_distances = []
 
-        for ent, (pos, team, entity_type) in esper.get_components(
-            Position, Team, EntityType
+        for ent, pos, unit_team_id, entity_type in self._get_team_units_of_type(
+            team_id, EntityType.CROSSBOWMAN
         ):
-            if team.team_id == team_id and entity_type == EntityType.CROSSBOWMAN:
-                distance = self._distance(pos, target_pos)
-                crossbowmen_distances.append((ent, distance))
+            distance = self._distance(pos, target_pos)
+            crossbowmen_distances.append((ent, pos, distance))
 
-        # Sort by distance and return the closest ones
-        crossbowmen_distances.sort(key=lambda x: x[1])
-        return [ent for ent, _ in crossbowmen_distances[:count]]
+        # Partial selection of the closest ones, no full sort needed
+        closest = heapq.nsmallest(count, crossbowmen_distances, key=itemgetter(2))
+        return [(ent, pos) for ent, pos, _ in closest]
 
     def _tactical_retreat(self, ent, pos, team_id):
         """Move to a defensive location (base or spawn corner) when outnumbered.
@@ -1667,12 +1937,13 @@ class LOVAAiSystem(esper.Processor):
             retreat_distance = 96  # 3 tiles from base
             direction_x = base_pos.x - pos.x
             direction_y = base_pos.y - pos.y
-            length = (direction_x**2 + direction_y**2) ** 0.5
+            length_sq = direction_x * direction_x + direction_y * direction_y
 
-            if length > retreat_distance:
+            if length_sq > retreat_distance * retreat_distance:
                 # Normalize and scale
-                direction_x = direction_x / length * retreat_distance
-                direction_y = direction_y / length * retreat_distance
+                scale = retreat_distance / math.sqrt(length_sq)
+                direction_x *= scale
+                direction_y *= scale
 
                 retreat_x = base_pos.x - direction_x
                 retreat_y = base_pos.y - direction_y
@@ -1688,11 +1959,7 @@ class LOVAAiSystem(esper.Processor):
                 self._defend_base(ent, pos, team_id)
         else:
             # Fallback: retreat to team spawn corner
-            if team_id == 2:  # Team 2 spawns bottom-right
-                corner_x, corner_y = 20 * 32, 20 * 32
-            else:  # Team 1 spawns top-left
-                corner_x, corner_y = 4 * 32, 4 * 32
-            retreat_pos = Position(corner_x, corner_y)
+            retreat_pos = self._get_fallback_base_position(team_id)
             self._smart_move_to(ent, pos, retreat_pos)
 
     def _defend_base(self, ent, pos, team_id):
@@ -1714,18 +1981,14 @@ class LOVAAiSystem(esper.Processor):
         base_pos = self._find_friendly_base(team_id)
         if not base_pos:
             # No base found, fallback to corner defense
-            if team_id == 2:
-                corner_x, corner_y = 20 * 32, 20 * 32
-            else:
-                corner_x, corner_y = 4 * 32, 4 * 32
-            base_pos = Position(corner_x, corner_y)
+            base_pos = self._get_fallback_base_position(team_id)
 
         # Look for enemies threatening the base
         enemies_near_base = []
-        for ent_enemy, (enemy_pos, enemy_team, enemy_type) in esper.get_components(
-            Position, Team, EntityType
+        for ent_enemy, enemy_pos, enemy_team_id, enemy_type in self._units_near(
+            self._get_enemy_grid(team_id), base_pos, 200
         ):
-            if enemy_team.team_id != team_id and enemy_type != EntityType.BASTION:
+            if enemy_type is not EntityType.BASTION:
                 distance_to_base = self._distance(enemy_pos, base_pos)
                 if distance_to_base <= 200:  # Enemies within 200 pixels of base
                     distance_to_self = self._distance(pos, enemy_pos)
@@ -1734,17 +1997,12 @@ class LOVAAiSystem(esper.Processor):
                     )
 
         if enemies_near_base:
-            # Attack closest enemy threatening the base
-            enemies_near_base.sort(key=lambda x: x[3])  # Sort by distance to self
-            closest_enemy = enemies_near_base[0]
+            # Attack closest enemy threatening the base (by distance to self)
+            closest_enemy = min(enemies_near_base, key=itemgetter(3))
             enemy_info = (closest_enemy[0], closest_enemy[1], closest_enemy[2])
 
             # Set target and engage
-            if not esper.has_component(ent, Target):
-                esper.add_component(ent, Target(closest_enemy[0]))
-            else:
-                target_comp = esper.component_for_entity(ent, Target)
-                target_comp.target_entity_id = closest_enemy[0]
+            self._set_combat_target(ent, closest_enemy[0])
 
             # Position for optimal defense (maintain distance but stay near base)
             distance_to_enemy = closest_enemy[3]
@@ -1754,32 +2012,34 @@ class LOVAAiSystem(esper.Processor):
                 # Get closer but don't move too far from base
                 direction_x = closest_enemy[1].x - pos.x
                 direction_y = closest_enemy[1].y - pos.y
-                length = (direction_x**2 + direction_y**2) ** 0.5
+                length_sq = direction_x * direction_x + direction_y * direction_y
 
-                if length > 0:
+                if length_sq > 0:
                     move_distance = min(40, distance_to_enemy - optimal_range)
-                    direction_x = direction_x / length * move_distance
-                    direction_y = direction_y / length * move_distance
+                    scale = move_distance / math.sqrt(length_sq)
+                    direction_x *= scale
+                    direction_y *= scale
 
                     new_x = pos.x + direction_x
                     new_y = pos.y + direction_y
 
                     # Don't move too far from base
-                    distance_to_base = self._distance(Position(new_x, new_y), base_pos)
+                    candidate = Position(new_x, new_y)
+                    distance_to_base = self._distance(candidate, base_pos)
                     if distance_to_base <= 150:  # Stay within 150 pixels of base
-                        destination = Position(new_x, new_y)
-                        self._smart_move_to(ent, pos, destination)
+                        self._smart_move_to(ent, pos, candidate)
                     else:
                         self._stop_movement(ent)
             elif distance_to_enemy < optimal_range * 0.7:
                 # Too close, back towards base
                 direction_x = base_pos.x - pos.x
                 direction_y = base_pos.y - pos.y
-                length = (direction_x**2 + direction_y**2) ** 0.5
+                length_sq = direction_x * direction_x + direction_y * direction_y
 
-                if length > 0:
-                    direction_x = direction_x / length * 30
-                    direction_y = direction_y / length * 30
+                if length_sq > 0:
+                    scale = 30 / math.sqrt(length_sq)
+                    direction_x *= scale
+                    direction_y *= scale
 
                     retreat_x = pos.x + direction_x
                     retreat_y = pos.y + direction_y
@@ -1801,11 +2061,12 @@ class LOVAAiSystem(esper.Processor):
                 # Too close to base, move to better defensive position
                 direction_x = pos.x - base_pos.x
                 direction_y = pos.y - base_pos.y
-                length = (direction_x**2 + direction_y**2) ** 0.5
+                length_sq = direction_x * direction_x + direction_y * direction_y
 
-                if length > 0:
-                    direction_x = direction_x / length * ideal_defense_distance
-                    direction_y = direction_y / length * ideal_defense_distance
+                if length_sq > 0:
+                    scale = ideal_defense_distance / math.sqrt(length_sq)
+                    direction_x *= scale
+                    direction_y *= scale
 
                     defense_x = base_pos.x + direction_x
                     defense_y = base_pos.y + direction_y
@@ -1846,10 +2107,10 @@ class LOVAAiSystem(esper.Processor):
         best_target = None
         min_distance = float("inf")
 
-        for target_ent, (target_pos, target_team, target_type) in esper.get_components(
-            Position, Team, EntityType
+        for target_ent, target_pos, target_team_id, target_type in self._units_near(
+            self._get_enemy_grid(team_id), brute_pos, 150
         ):
-            if target_team.team_id != team_id and target_type != EntityType.BASTION:
+            if target_type is not EntityType.BASTION:
                 distance_to_brute = self._distance(brute_pos, target_pos)
                 distance_to_self = self._distance(pos, target_pos)
 
@@ -1875,15 +2136,16 @@ class LOVAAiSystem(esper.Processor):
                 # Too far from BRUTE, get closer
                 direction_x = brute_pos.x - pos.x
                 direction_y = brute_pos.y - pos.y
-                length = (direction_x**2 + direction_y**2) ** 0.5
+                length_sq = direction_x * direction_x + direction_y * direction_y
 
-                if length > 0:
+                if length_sq > 0:
                     # Move closer but maintain some distance
                     move_distance = min(
                         40, distance_to_brute - optimal_support_distance
                     )
-                    direction_x = direction_x / length * move_distance
-                    direction_y = direction_y / length * move_distance
+                    scale = move_distance / math.sqrt(length_sq)
+                    direction_x *= scale
+                    direction_y *= scale
 
                     new_x = pos.x + direction_x
                     new_y = pos.y + direction_y
@@ -1905,28 +2167,12 @@ class LOVAAiSystem(esper.Processor):
 
         if enemies_in_range:
             # Prioritize targets: GHAST > CROSSBOWMAN > BRUTE
-            best_target = self._prioritize_targets(enemies_in_range)
+            best_target = self.target_prioritizer.prioritize_targets(enemies_in_range)
             self._attack_enemy(ent, pos, best_target, attack)
         else:
             # No enemies in range, advance towards enemy base
             self._attack_enemy_base(ent, pos, team_id)
 
-    def _prioritize_targets(self, enemies_in_range):
-        """Prioritize targets based on threat level."""
-        ghasts = [e for e in enemies_in_range if e[2] == EntityType.GHAST]
-        crossbowmen = [e for e in enemies_in_range if e[2] == EntityType.CROSSBOWMAN]
-        brutes = [e for e in enemies_in_range if e[2] == EntityType.BRUTE]
-
-        # Priority: GHAST > CROSSBOWMAN > BRUTE
-        if ghasts:
-            return ghasts[0]
-        elif crossbowmen:
-            return crossbowmen[0]
-        elif brutes:
-            return brutes[0]
-        else:
-            return enemies_in_range[0] if enemies_in_range else None
-
     def _follow_brute_for_combat(self, ent, pos, brute_pos):
         """Follow BRUTE ally for coordinated combat."""
         # Stay at optimal range behind BRUTE (support position)
@@ -1944,11 +2190,7 @@ class LOVAAiSystem(esper.Processor):
             self._smart_move_to(ent, pos, base_pos)
         else:
             # Fallback: retreat to team spawn corner
-            if team_id == 2:  # Team 2 spawns bottom-right
-                corner_x, corner_y = 20 * 32, 20 * 32
-            else:  # Team 1 spawns top-left
-                corner_x, corner_y = 4 * 32, 4 * 32
-            retreat_pos = Position(corner_x, corner_y)
+            retreat_pos = self._get_fallback_base_position(team_id)
             self._smart_move_to(ent, pos, retreat_pos)
 
     def _attack_enemy_base(self, ent, pos, team_id):
@@ -1969,30 +2211,18 @@ class LOVAAiSystem(esper.Processor):
             self._smart_move_to(ent, pos, enemy_base)
         else:
             # Fallback: attack enemy spawn corner
-            if enemy_team_id == 1:  # Attack team 1 corner (top-left)
-                corner_x, corner_y = 4 * 32, 4 * 32
-            else:  # Attack team 2 corner (bottom-right)
-                corner_x, corner_y = 20 * 32, 20 * 32
-            attack_pos = Position(corner_x, corner_y)
+            attack_pos = self._get_fallback_base_position(enemy_team_id)
             self._smart_move_to(ent, pos, attack_pos)
 
     def _find_friendly_base(self, team_id):
         """Find friendly BASTION."""
-        for ent, (pos, team, entity_type) in esper.get_components(
-            Position, Team, EntityType
-        ):
-            if team.team_id == team_id and entity_type == EntityType.BASTION:
-                return pos
-        return None
+        self._get_frame_units()
+        return self._bases_by_team.get(team_id)
 
     def _find_enemy_base(self, enemy_team_id):
         """Find enemy BASTION."""
-        for ent, (pos, team, entity_type) in esper.get_components(
-            Position, Team, EntityType
-        ):
-            if team.team_id == enemy_team_id and entity_type == EntityType.BASTION:
-                return pos
-        return None
+        self._get_frame_units()
+        return self._bases_by_team.get(enemy_team_id)
 
     def _move_to_center_smart(self, ent, pos):
         """Move the unit toward the map center using safe movement helpers.
@@ -2004,11 +2234,56 @@ class LOVAAiSystem(esper.Processor):
         Returns:
             None
         """
-        center_x = 12 * 32  # Center of 24x24 map in pixels
-        center_y = 12 * 32
+        self._smart_move_to(ent, pos, MAP_CENTER)
 
-        destination = Position(center_x, center_y)
-        self._smart_move_to(ent, pos, destination)
+    def _get_lava_cells(self, terrain_map):
+        """Return the set of LAVA grid cells for the given terrain map.
+
+        The set is rebuilt only when the terrain map is replaced or grows,
+        so path checks reduce to a membership test per tile.
+
+        Args:
+            terrain_map (dict): Mapping of (x, y) grid cells to terrain names
+
+        Returns:
+            frozenset: Grid cells whose terrain is LAVA
+        """
+        if not terrain_map:
+            return frozenset()
+
+        map_key = (id(terrain_map), len(terrain_map))
+        if map_key != self._lava_map_key:
+            self._lava_cells = frozenset(
+                cell for cell, terrain in terrain_map.items() if terrain == "LAVA"
+            )
+            self._lava_map_key = map_key
+        return self._lava_cells
+
+    def _prepare_path_safety(self):
+        """Resolve the terrain data shared by every path check of this tick.
+
+        The terrain map, its dimensions and the lava cells are looked up once
+        per tick instead of once per unit. Cached line results stay valid
+        until the terrain changes.
+        """
+        # Prefer using the shared pathfinding terrain map (more reliable)
+        pf = getattr(self, "pathfinding_system", None)
+        if pf and hasattr(pf, "terrain_map") and pf.terrain_map:
+            lava_cells = getattr(pf, "lava_cells", None)
+            if lava_cells is None:
+                lava_cells = self._get_lava_cells(pf.terrain_map)
+            map_w = getattr(pf, "map_width", None)
+            map_h = getattr(pf, "map_height", None)
+        else:
+            # Fallback to local cached copy
+            lava_cells = self._get_lava_cells(getattr(self, "terrain_map", None))
+            map_w = None
+            map_h = None
+
+        context = (lava_cells, map_w, map_h)
+        if self._path_safety_context != context:
+            self._path_safety_results.clear()
+        self._path_safety_context = context
 
     def _is_direct_path_safe(self, current_pos, destination):
         """Check if direct path is safe without obstacles like lava.
@@ -2020,66 +2295,85 @@ class LOVAAiSystem(esper.Processor):
         Returns:
             bool: True if path is safe, False if blocked by obstacles
         """
-        # Prefer using the shared pathfinding terrain map (more reliable)
-        try:
-            terrain_map = None
-            pf = getattr(self, "pathfinding_system", None)
-            if pf and hasattr(pf, "terrain_map") and pf.terrain_map:
-                terrain_map = pf.terrain_map
-                map_w = getattr(pf, "map_width", None)
-                map_h = getattr(pf, "map_height", None)
-            else:
-                # Fallback to local cached copy
-                terrain_map = getattr(self, "terrain_map", None)
-                map_w = None
-                map_h = None
+        # Standing on the destination needs no terrain check at all
+        if current_pos.x == destination.x and current_pos.y == destination.y:
+            return True
 
+        try:
             CELL_SIZE = 32
-            start_x = int(current_pos.x // CELL_SIZE)
-            start_y = int(current_pos.y // CELL_SIZE)
-            end_x = int(destination.x // CELL_SIZE)
-            end_y = int(destination.y // CELL_SIZE)
-
-            # Bresenham line algorithm on grid coordinates
-            dx = abs(end_x - start_x)
-            dy = abs(end_y - start_y)
-            x = start_x
-            y = start_y
-            x_inc = 1 if start_x < end_x else -1
-            y_inc = 1 if start_y < end_y else -1
-            error = dx - dy
-
-            # Step through the line and check terrain at each tile
-            while True:
-                # Bounds check if map dimensions are known
-                if map_w is not None and map_h is not None:
-                    if x < 0 or x >= map_w or y < 0 or y >= map_h:
-                        break
-
-                terrain = "WALKABLE"
-                if terrain_map is not None:
-                    terrain = terrain_map.get((x, y), "WALKABLE")
-
-                if terrain == "LAVA":
-                    return False
-
-                if x == end_x and y == end_y:
-                    break
-
-                e2 = 2 * error
-                if e2 > -dy:
-                    error -= dy
-                    x += x_inc
-                if e2 < dx:
-                    error += dx
-                    y += y_inc
-
-            # No lava found along the straight line
-            return True
+            line = (
+                int(current_pos.x // CELL_SIZE),
+                int(current_pos.y // CELL_SIZE),
+                int(destination.x // CELL_SIZE),
+                int(destination.y // CELL_SIZE),
+            )
+
+            # Moving within the current cell never crosses another tile
+            if line[0] == line[2] and line[1] == line[3]:
+                return True
+
+            if self._path_safety_context is None:
+                self._prepare_path_safety()
+
+            results = self._path_safety_results
+            is_safe = results.get(line)
+            if is_safe is None:
+                is_safe = self._is_grid_line_safe(*line)
+                results[line] = is_safe
+                if len(results) > PATH_SAFETY_CACHE_SIZE:
+                    results.popitem(last=False)
+            else:
+                results.move_to_end(line)
+            return is_safe
         except Exception:
             # If anything goes wrong, be conservative and request A*
             return False
 
+    def _is_grid_line_safe(self, start_x, start_y, end_x, end_y):
+        """Check whether a straight grid line crosses any lava cell.
+
+        Args:
+            start_x (int): Start cell column
+            start_y (int): Start cell row
+            end_x (int): End cell column
+            end_y (int): End cell row
+
+        Returns:
+            bool: True if no lava lies on the line
+        """
+        lava_cells, map_w, map_h = self._path_safety_context
+        if not lava_cells:
+            return True
+
+        # Integer DDA: one cell per step along the dominant axis, the other
+        # coordinate rounded from a running numerator over 2 * steps
+        delta_x = end_x - start_x
+        delta_y = end_y - start_y
+        steps = max(abs(delta_x), abs(delta_y))
+        denominator = 2 * steps or 1
+        numerator_x = numerator_y = steps
+
+        # Keep samples inside the grid if map dimensions are known
+        clamp = map_w is not None and map_h is not None
+        if clamp:
+            max_x = map_w - 1
+            max_y = map_h - 1
+
+        for _ in range(steps + 1):
+            x = start_x + numerator_x // denominator
+            y = start_y + numerator_y // denominator
+            if clamp:
+                x = min(max(x, 0), max_x)
+                y = min(max(y, 0), max_y)
+            # Stop at the first lava cell on the line
+            if (x, y) in lava_cells:
+                return False
+            numerator_x += 2 * delta_x
+            numerator_y += 2 * delta_y
+
+        # No lava found along the straight line
+        return True
+
     def _smart_move_to(self, ent, current_pos, destination):
         """Enhanced movement with pathfinding when obstacles are detected.
 
@@ -2119,19 +2413,19 @@ class LOVAAiSystem(esper.Processor):
             None
         """
         # Ensure entity has a Velocity component
-        if not esper.has_component(ent, Velocity):
+        if esper.try_component(ent, Velocity) is None:
             esper.add_component(ent, Velocity(x=0, y=0, speed=2))
 
         # Use the event system for proper movement
-        EventBus.get_event_bus().emit(EventMoveTo(ent, target_x, target_y))
+        self.event_bus.emit(EventMoveTo(ent, target_x, target_y))
 
     def _request_pathfinding(self, ent, current_pos, destination):
         """Request A* pathfinding to navigate around obstacles."""
         # Add or update PathRequest component
-        if not esper.has_component(ent, PathRequest):
-            esper.add_component(ent, PathRequest())
-
-        path_request = esper.component_for_entity(ent, PathRequest)
+        path_request = esper.try_component(ent, PathRequest)
+        if path_request is None:
+            path_request = PathRequest()
+            esper.add_component(ent, path_request)
         path_request.destination = destination
         path_request.path = None  # Clear old path to trigger new calculation
         path_request.current_index = 0
@@ -2178,8 +2472,8 @@ class LOVAAiSystem(esper.Processor):
 
     def _stop_movement(self, ent):
         """Stop entity movement by setting velocity to zero."""
-        if esper.has_component(ent, Velocity):
-            vel = esper.component_for_entity(ent, Velocity)
+        vel = esper.try_component(ent, Velocity)
+        if vel is not None:
             vel.x = 0
             vel.y = 0
 
@@ -4,10 +4,13 @@ import math
 from typing import List, Tuple, Optional, Set
 
 from components.base.position import Position
+from components.base.team import Team
 from components.ai import PathRequest
 from core.data_bus import DataBus
+from core.game.map import Map
 from enums.case_type import CaseType
-from core.accessors import get_map
+from enums.entity.entity_type import EntityType
+from core.accessors import get_debugger, get_map
 
 
 class Node:
@@ -61,6 +64,7 @@ class PathfindingSystem(esper.Processor):
         map_width (int): Width of the game map in tiles
         map_height (int): Height of the game map in tiles
         terrain_map (dict): Dictionary mapping grid coordinates to terrain types
+        lava_cells (frozenset): Grid coordinates whose terrain is LAVA
     """
 
     def __init__(self, tile_size: int = 32):
@@ -75,6 +79,7 @@ class PathfindingSystem(esper.Processor):
         self.map_width = 24
         self.map_height = 24
         self.terrain_map = {}  # Terrain data storage
+        self.lava_cells = frozenset()  # LAVA tiles, derived from terrain_map
         self._terrain_loaded = False  # Flag to prevent reloading
         self._load_terrain_map()
 
@@ -99,37 +104,21 @@ class PathfindingSystem(esper.Processor):
         self.terrain_map = {}
 
         try:
-            from core.game.map import Map
-            from enums.case_type import CaseType
-
             map_found = False
 
-            # Try to get all entities and check for Map components
-            all_entities = (
-                list(esper._entities.keys()) if hasattr(esper, "_entities") else []
-            )
-
             # Method 1: Try the original way
-            if get_map():
-                self._process_map_data(get_map())
+            game_map = get_map()
+            if game_map:
+                self._process_map_data(game_map)
                 map_found = True
 
-            # Method 2: If not found, try checking all entities directly
+            # Method 2: If not found, look for a Map component on any entity
             if not map_found:
-                for entity_id in all_entities:
-                    try:
-                        if esper.has_component(entity_id, Map):
-                            map_comp = esper.component_for_entity(entity_id, Map)
-                            if (
-                                isinstance(map_comp, Map)
-                                and hasattr(map_comp, "tab")
-                                and map_comp.tab
-                            ):
-                                map_found = True
-                                self._process_map_data(map_comp)
-                                break
-                    except Exception:
-                        continue
+                for entity_id, map_comp in esper.get_component(Map):
+                    if hasattr(map_comp, "tab") and map_comp.tab:
+                        map_found = True
+                        self._process_map_data(map_comp)
+                        break
 
             if not map_found:
                 print("[Pathfinding] NO MAP FOUND - Using default terrain map")
@@ -141,6 +130,10 @@ class PathfindingSystem(esper.Processor):
             print(f"[Pathfinding] ERROR loading map: {e}")
             self._create_default_terrain()
 
+        # Index lava tiles once so consumers never rescan the whole map
+        self.lava_cells = frozenset(
+            cell for cell, terrain in self.terrain_map.items() if terrain == "LAVA"
+        )
         self._terrain_loaded = True
 
     def _process_map_data(self, map_comp):
@@ -150,8 +143,6 @@ class PathfindingSystem(esper.Processor):
         Args:
             map_comp: Map component containing terrain data
         """
-        from enums.case_type import CaseType
-
         for y in range(len(map_comp.tab)):
             for x in range(len(map_comp.tab[y])):
                 case = map_comp.tab[y][x]
@@ -234,6 +225,10 @@ class PathfindingSystem(esper.Processor):
             float: Additional cost penalty for lava proximity
         """
         proximity_cost = 0.0
+        # Resolved once, this runs for every neighbor A* expands
+        terrain_get = self.terrain_map.get
+        map_width = self.map_width
+        map_height = self.map_height
 
         # Check within a 2-tile radius around current position
         for dx in range(-2, 3):
@@ -242,9 +237,9 @@ class PathfindingSystem(esper.Processor):
                     continue
 
                 check_x, check_y = x + dx, y + dy
-                if 0 <= check_x < self.map_width and 0 <= check_y < self.map_height:
+                if 0 <= check_x < map_width and 0 <= check_y < map_height:
 
-                    terrain = self.terrain_map.get((check_x, check_y), "WALKABLE")
+                    terrain = terrain_get((check_x, check_y), "WALKABLE")
                     if terrain == "LAVA":
                         distance = abs(dx) + abs(dy)  # Manhattan distance
                         if distance == 1:
@@ -266,9 +261,6 @@ class PathfindingSystem(esper.Processor):
         Returns:
             bool: True if tile is occupied by another unit, False otherwise
         """
-        from components.base.team import Team
-        from enums.entity.entity_type import EntityType
-
         target_x = x * self.tile_size
         target_y = y * self.tile_size
 
@@ -360,14 +352,16 @@ class PathfindingSystem(esper.Processor):
         end_x = max(0, min(end_x, self.map_width - 1))
         end_y = max(0, min(end_y, self.map_height - 1))
 
-        # Temporary debug to see if function is called
-        if self.debug_mode:
-            print(
-                f"PATHFINDING DEMANDE pour entité {entity_id} de ({start_x},{start_y}) vers ({end_x},{end_y})"
-            )
-
         # Add debug info if debug mode is active
         if self.debug_mode:
+            get_debugger().log(
+                "PATHFINDING DEMANDE pour entité %s de (%s,%s) vers (%s,%s)",
+                entity_id,
+                start_x,
+                start_y,
+                end_x,
+                end_y,
+            )
             self._add_debug_text(
                 f"Entity {entity_id}: Start({start_x},{start_y}) -> Goal({end_x},{end_y})",
                 (start_pos.x, start_pos.y - 40),
@@ -142,9 +142,6 @@ class RenderSystem(IteratingProcessor):
                 # Copy to not modify original
                 frame = frame.copy()
 
-                red_tint = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
-                red_tint.fill((255, 0, 0, 50))
-
                 # Tinted mask
                 mask = pygame.mask.from_surface(frame)
                 mask_surface = mask.to_surface(
@@ -183,10 +180,9 @@ class RenderSystem(IteratingProcessor):
                     self.draw_surface(sprite, pos_x, pos_y)
 
     def _set_animation(self, ent: int, animation: Animation):
-        if esper.has_component(ent, Velocity) and esper.has_component(ent, Sprite):
-            velocity: Velocity = esper.component_for_entity(ent, Velocity)
-            sprite: Sprite = esper.component_for_entity(ent, Sprite)
-
+        velocity: Velocity = esper.try_component(ent, Velocity)
+        sprite: Sprite = esper.try_component(ent, Sprite)
+        if velocity is not None and sprite is not None:
             if velocity.x != 0 and velocity.y != 0:
                 direction: Direction = self._get_direction_from_velocity(velocity)
             else:
@@ -370,7 +366,7 @@ class RenderSystem(IteratingProcessor):
 
         # Debug temporaire
         if health.remaining == 0 and health.full > 0:
-            get_debugger().warning(f"Unit {ent} has 0/{health.full} HP!")
+            get_debugger().warning("Unit %s has 0/%s HP!", ent, health.full)
 
         # Green part for remaining health
         hp_ratio = max(0, min(1.0, health.remaining / health.full))
@@ -20,6 +20,10 @@ class SCPRAISystem(IteratingProcessor):
         self.map_size = 0
         self.ai_mapping = get_ai_mapping()
 
+        # Instantanés par tick, remplis dans process()
+        self._positions_by_team = {}
+        self._units_by_team_type = {}
+
     # -----------------------------------------------------------
     #                   Fonctions utiles
     # -----------------------------------------------------------
@@ -229,20 +233,21 @@ class SCPRAISystem(IteratingProcessor):
         # Calculer la distance de danger (65% de la portée d'attaque)
         danger_distance = unit_attack.range * 0.65
 
-        # Parcourir toutes les entités pour trouver les ennemis
-        for ent, (pos, team) in esper.get_components(Position, Team):
-            # Ignorer l'unité elle-même et les alliés
-            if ent == unit_ent or team.team_id == unit_team.team_id:
+        # Parcourir les entités des autres équipes pour trouver les ennemis
+        for team_id, units in self._positions_by_team.items():
+            # Ignorer les alliés
+            if team_id == unit_team.team_id:
                 continue
 
-            # Calculer la distance avec l'ennemi
-            dx = pos.x - unit_pos.x
-            dy = pos.y - unit_pos.y
-            distance = (dx**2 + dy**2) ** 0.5
+            for ent, pos in units:
+                # Calculer la distance avec l'ennemi
+                dx = pos.x - unit_pos.x
+                dy = pos.y - unit_pos.y
+                distance = (dx**2 + dy**2) ** 0.5
 
-            # Si un ennemi est trop proche, l'unité est en danger
-            if distance <= danger_distance:
-                return True
+                # Si un ennemi est trop proche, l'unité est en danger
+                if distance <= danger_distance:
+                    return True
 
         return False
 
@@ -255,17 +260,10 @@ class SCPRAISystem(IteratingProcessor):
         return esper.get_component(Structure)[self_team - 1][0]
 
     def get_units(self, searched_unit: EntityType = EntityType.BRUTE):
-        unit_sorted = [[], []]
-        unit_list = esper.get_component(EntityType)
-        unit_list = list(filter(lambda x: x[1] == searched_unit, unit_list))
-        for ent in unit_list:
-            team = esper.component_for_entity(ent[0], Team)
-            pos = esper.component_for_entity(ent[0], Position)
-            if team.team_id == PLAYER_1_TEAM:
-                unit_sorted[0].append((ent[0], pos, team))
-            elif team.team_id == PLAYER_2_TEAM:
-                unit_sorted[1].append((ent[0], pos, team))
-        return unit_sorted
+        return [
+            self._units_by_team_type.get((PLAYER_1_TEAM, searched_unit), []),
+            self._units_by_team_type.get((PLAYER_2_TEAM, searched_unit), []),
+        ]
 
     def find_nearest_ally_ghast(self, self_ent, self_team, max_distance=350):
         """
@@ -274,18 +272,15 @@ class SCPRAISystem(IteratingProcessor):
         nearest_ghast = None
         min_distance = float("inf")
 
-        # Parcourir toutes les entités pour trouver les Ghast alliés
-        for ent, (entity_type, team, pos) in esper.get_components(
-            EntityType, Team, Position
+        self_pos = esper.component_for_entity(self_ent, Position)
+
+        # Parcourir les Ghast alliés
+        for ent, pos, team in self._units_by_team_type.get(
+            (self_team, EntityType.GHAST), []
         ):
-            if (
-                ent != self_ent
-                and team.team_id == self_team
-                and entity_type == EntityType.GHAST
-            ):
+            if ent != self_ent:
 
                 # Calculer la distance avec le Ghast
-                self_pos = esper.component_for_entity(self_ent, Position)
                 dx = pos.x - self_pos.x
                 dy = pos.y - self_pos.y
                 distance = (dx**2 + dy**2) ** 0.5
@@ -303,18 +298,15 @@ class SCPRAISystem(IteratingProcessor):
         nearest_crossbow = None
         min_distance = float("inf")
 
-        # Parcourir toutes les entités pour trouver les Crossbow ennemis
-        for ent, (entity_type, team, pos) in esper.get_components(
-            EntityType, Team, Position
-        ):
-            if (
-                ent != self_ent
-                and team.team_id != self_team
-                and entity_type == EntityType.CROSSBOWMAN
-            ):
+        self_pos = esper.component_for_entity(self_ent, Position)
+
+        # Parcourir les Crossbow des équipes ennemies
+        for (team_id, entity_type), units in self._units_by_team_type.items():
+            if team_id == self_team or entity_type != EntityType.CROSSBOWMAN:
+                continue
 
+            for ent, pos, team in units:
                 # Calculer la distance avec l'archer ennemi
-                self_pos = esper.component_for_entity(self_ent, Position)
                 dx = pos.x - self_pos.x
                 dy = pos.y - self_pos.y
                 distance = (dx**2 + dy**2) ** 0.5
@@ -327,8 +319,9 @@ class SCPRAISystem(IteratingProcessor):
 
     def get_attack_range(self, ent):
         """Récupère la portée d'attaque d'une entité"""
-        if esper.has_component(ent, Attack):
-            return esper.component_for_entity(ent, Attack).range
+        attack = esper.try_component(ent, Attack)
+        if attack is not None:
+            return attack.range
         return 0
 
     # -----------------------------------------------------------
@@ -345,8 +338,11 @@ class SCPRAISystem(IteratingProcessor):
         closest_enemy = None
         min_distance = float("inf")
 
-        for ent, (pos, team) in esper.get_components(Position, Team):
-            if team.team_id != self_team and ent != self_ent:
+        for team_id, units in self._positions_by_team.items():
+            if team_id == self_team:
+                continue
+
+            for ent, pos in units:
                 dx = pos.x - self_pos.x
                 dy = pos.y - self_pos.y
                 distance = (dx**2 + dy**2) ** 0.5
@@ -480,6 +476,28 @@ class SCPRAISystem(IteratingProcessor):
     #                   boucle principale
     # -----------------------------------------------------------
 
+    def process(self, dt):
+        """
+        Regroupe les unités par équipe et par type une seule fois par tick,
+        puis traite chaque entité.
+
+        Args:
+            dt: Temps écoulé depuis la dernière frame
+        """
+        self._positions_by_team = {}
+        for ent, (pos, team) in esper.get_components(Position, Team):
+            self._positions_by_team.setdefault(team.team_id, []).append((ent, pos))
+
+        self._units_by_team_type = {}
+        for ent, (entity_type, team, pos) in esper.get_components(
+            EntityType, Team, Position
+        ):
+            self._units_by_team_type.setdefault((team.team_id, entity_type), []).append(
+                (ent, pos, team)
+            )
+
+        super().process(dt)
+
     def process_entity(
         self,
         ent: int,
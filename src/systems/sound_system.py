@@ -29,6 +29,13 @@ class SoundSystem(esper.Processor):
         "button_clicked": pygame.mixer.Sound("assets/audio/sounds/button_clicked.ogg"),
     }
 
+    # Son de mort joué pour chaque type d'entité
+    DEATH_SOUNDS = {
+        EntityType.BRUTE: "piglin_death",
+        EntityType.CROSSBOWMAN: "piglin_death",
+        EntityType.GHAST: "ghast_death",
+    }
+
     # Répertoire des musiques (on pourra en ajouter pour le menu par exemple)
     MUSICS = {"pigstep": "assets/audio/pigstep.mp3"}
 
@@ -122,13 +129,15 @@ class SoundSystem(esper.Processor):
         Play correct death sound according to entity type
         """
 
-        # Get entity type
-        entity_type = esper.component_for_entity(event.entity, EntityType)
+        # Get entity type (the entity may already have been removed)
+        try:
+            entity_type = esper.try_component(event.entity, EntityType)
+        except KeyError:
+            return
 
         # Play correct sound
-        if entity_type == EntityType.BRUTE or entity_type == EntityType.CROSSBOWMAN:
-            SoundSystem.SOUNDS["piglin_death"].play()
-        elif entity_type == EntityType.GHAST:
-            SoundSystem.SOUNDS["ghast_death"].play()
+        sound = SoundSystem.DEATH_SOUNDS.get(entity_type)
+        if sound is not None:
+            SoundSystem.SOUNDS[sound].play()
 
         # On pourra rajouter le bastion si nécessaire et le beacon si implémenté
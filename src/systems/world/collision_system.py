@@ -69,8 +69,8 @@ class CollisionSystem(IteratingProcessor):
         if esper.has_component(ent, Fly):
             return UnitType.FLY
 
-        if esper.has_component(ent, UnitType):
-            unit_type = esper.component_for_entity(ent, UnitType)
+        unit_type = esper.try_component(ent, UnitType)
+        if unit_type is not None:
             return unit_type
 
         return UnitType.WALK
@@ -196,8 +196,8 @@ class CollisionSystem(IteratingProcessor):
             pos.y = tile_bottom + collider.height // 2 + 1
 
         # Stop velocity in collision direction
-        if esper.has_component(ent, Velocity):
-            vel = esper.component_for_entity(ent, Velocity)
+        vel = esper.try_component(ent, Velocity)
+        if vel is not None:
             if min_overlap in [overlap_left, overlap_right]:
                 vel.x = 0
             if min_overlap in [overlap_top, overlap_bottom]:
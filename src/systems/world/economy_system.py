@@ -1,14 +1,22 @@
+from bisect import bisect_left
+
 import esper
 import pygame
 from components.base.team import Team
-from core.accessors import get_config, get_debugger, get_player_manager
+from core.accessors import get_debugger, get_player_manager
 from core.game.player import Player
 from events.buy_event import BuyEvent
 from events.death_event import DeathEvent
 from events.give_gold_event import GiveGoldEvent
 from components.base.cost import Cost
 from components.gameplay.squad import Squad
-from core.ecs.iterator_system import IteratingProcessor
+
+# Paliers de temps (ms) et vitesse de génération de l'or associée à chaque palier
+GENERATION_THRESHOLDS = (60000, 120000, 180000, 240000)
+GENERATION_SPEEDS = (1, 1.15, 1.25, 1.35, 1.5)
+
+# Quantité maximale d'or qu'un joueur peut posséder
+MONEY_CAP = 1500
 
 
 class EconomySystem(esper.Processor):
@@ -20,7 +28,9 @@ class EconomySystem(esper.Processor):
         event_bus.subscribe(GiveGoldEvent, self.give_gold)
 
         self.creation_time = pygame.time.get_ticks()
-        self.generation_speed = 1  # Valeur de base pour 0-1 minute
+        self.generation_speed = GENERATION_SPEEDS[0]  # Valeur de base pour 0-1 minute
+        # Temps écoulé (ms) au-delà duquel la vitesse de génération change
+        self._next_speed_change = GENERATION_THRESHOLDS[0]
 
     def buy(self, event):
         player: Player = event.player
@@ -34,11 +44,14 @@ class EconomySystem(esper.Processor):
             money -= cost.amount
             squad.troops.append(entity)
             get_debugger().log(
-                f"Vous avez acheté {entity} pour {cost.amount}. Il vous reste: {money} pépites d'or"
+                "Vous avez acheté %s pour %s. Il vous reste: %s pépites d'or",
+                entity,
+                cost.amount,
+                money,
             )
         else:
             get_debugger().log(
-                f"Il vous manqua {cost.amount - money} pour acheter {entity}"
+                "Il vous manqua %s pour acheter %s", cost.amount - money, entity
             )
 
     def reward_money(self, event: DeathEvent):
@@ -47,43 +60,37 @@ class EconomySystem(esper.Processor):
         if esper.has_component(entity, Cost):
             entity_cost = esper.component_for_entity(entity, Cost)
         else:
-            get_debugger().warning(f"{entity} n'a pas de coût")
+            get_debugger().warning("%s n'a pas de coût", entity)
             entity_cost = Cost(0)
         player: Player = get_player_manager().players[player_team.team_id]
 
         reward = int(entity_cost.amount / 10)  # 10% du prix de l'entité
 
-        if (
-            player.money + reward >= 1500
-        ):  # cap de thunes (à définir quelque part peut etre un fichier de constantes)
-            player.money = 1500
-        else:
-            player.money += reward
+        player.money = min(player.money + reward, MONEY_CAP)
 
-        get_debugger().log(f"Vous avez tué {entity} et gagné {reward} pepites d'or")
+        get_debugger().log("Vous avez tué %s et gagné %s pepites d'or", entity, reward)
 
     def process(self, dt):
 
         # Récupération du temps écoulé
         time_elapsed = pygame.time.get_ticks() - self.creation_time
 
-        # Changement de la vitesse de génération en fonction du temps
-        if 60000 < time_elapsed < 120000:
-            self.generation_speed = 1.15
-        elif 120000 < time_elapsed < 180000:
-            self.generation_speed = 1.25
-        elif 180000 < time_elapsed < 240000:
-            self.generation_speed = 1.35
-        elif time_elapsed > 240000:
-            self.generation_speed = 1.5
+        # Changement de la vitesse de génération, seulement quand le palier
+        # suivant est franchi (le temps écoulé ne fait qu'augmenter)
+        if time_elapsed > self._next_speed_change:
+            step = bisect_left(GENERATION_THRESHOLDS, time_elapsed)
+            self.generation_speed = GENERATION_SPEEDS[step]
+            self._next_speed_change = (
+                GENERATION_THRESHOLDS[step]
+                if step < len(GENERATION_THRESHOLDS)
+                else float("inf")
+            )
 
+        generation_speed = self.generation_speed
         players: dict[int, Player] = get_player_manager().players
-        # Ajout de la thune aux comptes des joueurs
-        for team in players:
-            if players[team].money + self.generation_speed >= 1500:  # Cap
-                players[team].money = 1500
-            else:
-                players[team].money += self.generation_speed
+        # Ajout de la thune aux comptes des joueurs, plafonnée
+        for player in players.values():
+            player.money = min(player.money + generation_speed, MONEY_CAP)
 
     def give_gold(self, event: GiveGoldEvent):
         # Read config to determine if give-gold debug is enabled and amount
@@ -101,11 +108,11 @@ class EconomySystem(esper.Processor):
         player: Player = get_player_manager().get_current_player()
 
         # Apply cap similar to other money gains
-        if player.money + amount >= 1500:
-            player.money = 1500
-        else:
-            player.money += amount
+        player.money = min(player.money + amount, MONEY_CAP)
 
-        print(
-            f"[DEBUG] Ajout de {amount} pépites d'or au joueur {player.team_number}. Nouveau solde: {player.money}"
+        get_debugger().log(
+            "Ajout de %s pépites d'or au joueur %s. Nouveau solde: %s",
+            amount,
+            player.team_number,
+            player.money,
         )
@@ -1,5 +1,5 @@
 import esper
-from core.ecs.component import Slowed, Blocked
+from components.gameplay.effects import Slowed
 from core.ecs.iterator_system import IteratingProcessor
 
 
@@ -25,8 +25,13 @@ class EffectSystem(IteratingProcessor):
         Args:
             dt: Time to add to effect timers
         """
+        # get_component returns a cached list, so removing while iterating is safe
         for ent, slowed in esper.get_component(Slowed):
-            if slowed.duration is not None:
-                slowed.timer += dt
-                if slowed.timer >= slowed.duration:
-                    esper.remove_component(ent, Slowed)
+            duration = slowed.duration
+            if duration is None:
+                # Terrain slows have no duration and are handled elsewhere
+                continue
+            timer = slowed.timer + dt
+            slowed.timer = timer
+            if timer >= duration:
+                esper.remove_component(ent, Slowed)
@@ -51,8 +51,8 @@ class MovementSystem(IteratingProcessor):
         speed_modifier = 1.0
 
         # Apply slowdown from terrain effects
-        if esper.has_component(ent, Slowed):
-            slowed = esper.component_for_entity(ent, Slowed)
+        slowed = esper.try_component(ent, Slowed)
+        if slowed is not None:
             speed_modifier *= slowed.factor
 
         effective_speed = base_speed * speed_modifier * Config.TILE_SIZE()
@@ -36,9 +36,10 @@ class PlayerMoveSystem(IteratingProcessor):
         if pos and vel:
             dx = event.target_x - pos.x
             dy = event.target_y - pos.y
-            dist = (dx**2 + dy**2) ** 0.5
+            dist_sq = dx * dx + dy * dy
 
-            if dist > 16:
+            if dist_sq > 256:
+                dist = dist_sq**0.5
                 speed = vel.speed
                 vel.x = (dx / dist) * speed
                 vel.y = (dy / dist) * speed
@@ -54,10 +55,7 @@ class PlayerMoveSystem(IteratingProcessor):
             pos: Entity current position
             vel: Entity velocity to update
         """
-        ctrl: AIController = None
-
-        if esper.has_component(ent, AIController):
-            ctrl = esper.component_for_entity(ent, AIController)
+        ctrl: AIController = esper.try_component(ent, AIController)
 
         if ent in self.target:
             if ctrl and isinstance(ctrl.state, BruteAiState):
@@ -70,9 +68,9 @@ class PlayerMoveSystem(IteratingProcessor):
             tx, ty = self.target[ent]
             dx = tx - pos.x
             dy = ty - pos.y
-            dist = (dx**2 + dy**2) ** 0.5
+            dist_sq = dx * dx + dy * dy
             # Stop when close to target
-            if dist < 5:
+            if dist_sq < 25:
                 vel.x = 0
                 vel.y = 0
                 del self.target[ent]
@@ -88,5 +86,6 @@ class PlayerMoveSystem(IteratingProcessor):
             else:
                 # Keep moving towards target
                 speed = 100
+                dist = dist_sq**0.5
                 vel.x = (dx / dist) * speed
                 vel.y = (dy / dist) * speed
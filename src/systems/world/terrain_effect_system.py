@@ -71,8 +71,8 @@ class TerrainEffectSystem(IteratingProcessor):
         Args:
             ent: Entity ID to clear effects from
         """
-        if esper.has_component(ent, Slowed):
-            slowed = esper.component_for_entity(ent, Slowed)
+        slowed = esper.try_component(ent, Slowed)
+        if slowed is not None:
             if slowed.source == SourceEffect.TERRAIN:
                 esper.remove_component(ent, Slowed)
 